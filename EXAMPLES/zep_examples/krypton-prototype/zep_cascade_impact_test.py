@@ -7,16 +7,154 @@ easily invalidated or changed.
 
 import os
 import uuid
-import json
 import time
-from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
+from zep_cloud import EpisodeData
 from zep_cloud.client import Zep
+from zep_common import flush_log, get_logger, list_all
 
 # Load environment variables
 load_dotenv()
 
+logger = get_logger(__name__)
+
+# Episode texts, kept unindented so no leading whitespace is sent to Zep
+COMPANY_STRUCTURE = """
+MegaCorp is the parent company that owns TechDivision, FinanceDivision, and RetailDivision.
+TechDivision manages 500 employees and generates $100M revenue annually.
+FinanceDivision manages 300 employees and generates $80M revenue annually.
+RetailDivision manages 1000 employees and generates $200M revenue annually.
+
+John Smith is the CEO of MegaCorp since 2015.
+Sarah Johnson is the CTO of TechDivision reporting to John Smith.
+Michael Brown is the CFO of FinanceDivision reporting to John Smith.
+Emily Davis is the COO of RetailDivision reporting to John Smith.
+
+All divisions are headquartered in Silicon Valley Campus.
+The Silicon Valley Campus was established in 2010 and houses 1800 employees total.
+""".strip()
+
+PRODUCT_ECOSYSTEM = """
+TechDivision develops CloudPlatform, which is used by FinanceDivision and RetailDivision.
+CloudPlatform processes 10 million transactions daily across all divisions.
+FinanceDivision's TradingSystem depends entirely on CloudPlatform for real-time processing.
+RetailDivision's InventorySystem depends entirely on CloudPlatform for synchronization.
+
+CloudPlatform is maintained by the Platform Team led by Sarah Johnson.
+The Platform Team consists of 50 engineers including Alex Chen, Lisa Wang, and David Lee.
+Alex Chen is the lead architect of CloudPlatform's core infrastructure.
+Lisa Wang manages CloudPlatform's security protocols.
+David Lee oversees CloudPlatform's API integrations.
+""".strip()
+
+FINANCIAL_DEPENDENCIES = """
+MegaCorp's total valuation is $2 billion based on combined division performance.
+TechDivision's CloudPlatform generates $50M of its $100M revenue.
+FinanceDivision pays TechDivision $10M annually for CloudPlatform usage.
+RetailDivision pays TechDivision $15M annually for CloudPlatform usage.
+
+John Smith owns 30% of MegaCorp shares worth $600M.
+Sarah Johnson owns 5% of MegaCorp shares worth $100M.
+Michael Brown owns 3% of MegaCorp shares worth $60M.
+Emily Davis owns 3% of MegaCorp shares worth $60M.
+
+MegaCorp's board includes John Smith, Sarah Johnson, and external directors.
+The board meets quarterly at Silicon Valley Campus.
+""".strip()
+
+PARTNERSHIPS = """
+MegaCorp has exclusive partnerships with CloudProvider Inc and DataAnalytics Corp.
+CloudProvider Inc provides infrastructure for CloudPlatform at $5M annually.
+DataAnalytics Corp processes all customer data for RetailDivision.
+
+John Smith serves on the board of CloudProvider Inc.
+Sarah Johnson collaborates with CloudProvider Inc's technical team.
+Michael Brown manages the financial relationship with DataAnalytics Corp.
+
+All three divisions depend on CloudProvider Inc's infrastructure.
+CloudProvider Inc's CEO James Wilson meets monthly with John Smith.
+The partnership agreements are reviewed annually by the board.
+""".strip()
+
+CUSTOMERS = """
+RetailDivision serves 1 million customers through CloudPlatform's e-commerce system.
+FinanceDivision manages $500M in assets for 10,000 clients through TradingSystem.
+TechDivision has 100 enterprise clients using CloudPlatform directly.
+
+BigRetailer is RetailDivision's largest customer generating $50M annually.
+InvestmentFirm is FinanceDivision's largest client with $100M under management.
+TechStartup is TechDivision's newest client paying $1M annually for CloudPlatform.
+
+Customer satisfaction depends on CloudPlatform's 99.9% uptime guarantee.
+All customer data is stored in Silicon Valley Campus data centers.
+""".strip()
+
+# Master graph episodes as (title, text)
+MASTER_EPISODES = (
+    ("Company Structure", COMPANY_STRUCTURE),
+    ("Product Ecosystem", PRODUCT_ECOSYSTEM),
+    ("Financial Dependencies", FINANCIAL_DEPENDENCIES),
+    ("Strategic Relationships", PARTNERSHIPS),
+    ("Customer Dependencies", CUSTOMERS)
+)
+
+# This small change will cascade through the graph
+DISRUPTIVE_EPISODE = """
+BREAKING NEWS: As of today, John Smith has resigned as CEO of MegaCorp effective immediately.
+Sarah Johnson has been appointed as the new CEO of MegaCorp.
+Sarah Johnson is no longer CTO of TechDivision.
+Alex Chen has been promoted to CTO of TechDivision replacing Sarah Johnson.
+
+MegaCorp is relocating headquarters from Silicon Valley Campus to Austin, Texas.
+The Silicon Valley Campus will be closed by end of year.
+CloudPlatform will be migrated to CloudProvider Inc's Texas datacenter.
+""".strip()
+
+# What the disruptive episode contains and what it is expected to affect
+DISRUPTION_CONTENTS = (
+    "3 leadership changes",
+    "1 headquarters relocation",
+    "1 datacenter migration"
+)
+
+DISRUPTION_IMPACTS = (
+    "Invalidates CEO/CTO relationships",
+    "Affects all 'reporting to' edges",
+    "Impacts location-based relationships",
+    "Changes infrastructure dependencies",
+    "Affects board composition",
+    "Modifies shareholding contexts"
+)
+
+
+def _truncate(text: str, width: int = 80) -> str:
+    """Shorten text to width characters, marking the cut with an ellipsis"""
+    return text[:width] + "..." if len(text) > width else text
+
+
+@dataclass
+class EntityRec:
+    """An entity found while analyzing a graph"""
+    __slots__ = ("uuid", "name", "type")
+    uuid: str
+    name: str
+    type: str
+
+
+@dataclass
+class EdgeRec:
+    """A relationship found while analyzing a graph"""
+    __slots__ = ("uuid", "fact", "type", "invalid_at")
+    uuid: str
+    fact: str
+    type: str
+    invalid_at: Optional[Any]
+
+
 class ZepCascadeImpactTester:
     """Test cascading impact of small changes on interconnected graphs"""
     
@@ -27,13 +165,63 @@ class ZepCascadeImpactTester:
             raise ValueError("Please set your ZEP_API_KEY in the .env file")
         
         self.client = Zep(api_key=api_key)
-        print("✅ Connected to Zep Cascade Impact Tester")
+        # analyze_graph_state results by (graph_id, baseline graph_id), dropped
+        # when the graph changes
+        self._state_cache: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        logger.info("✅ Connected to Zep Cascade Impact Tester")
+    
+    def _invalidate_state(self, graph_id: str):
+        """Drop cached analyze_graph_state results for a graph"""
+        # list() snapshots the keys in one step, so a background analysis
+        # can store its result while this runs
+        for key in list(self._state_cache):
+            if key[0] == graph_id:
+                self._state_cache.pop(key, None)
+    
+    def add_episode(self, graph_id: str, data: str):
+        """Add a text episode to a graph and invalidate its cached state"""
+        self._invalidate_state(graph_id)
+        return self.client.graph.add(
+            graph_id=graph_id,
+            type="text",
+            data=data
+        )
+    
+    def add_episodes(self, graph_id: str, texts: List[str]):
+        """Add text episodes to a graph in one batch and invalidate its cached state"""
+        self._invalidate_state(graph_id)
+        return self.client.graph.add_batch(
+            graph_id=graph_id,
+            episodes=[EpisodeData(data=text, type="text") for text in texts]
+        )
+    
+    def wait_for_episodes(self, episode_uuids: List[str], max_wait: int = 30):
+        """Wait until all episodes are processed, polling with exponential backoff"""
+        flush_log()
+        pending = set(episode_uuids)
+        start = time.time()
+        delay = 0.5
+        while pending and time.time() - start < max_wait:
+            for episode_uuid in list(pending):
+                try:
+                    if self.client.graph.episode.get(uuid_=episode_uuid).processed:
+                        pending.discard(episode_uuid)
+                except Exception as e:
+                    logger.warning(f"⚠️ Error checking episode status: {e}")
+            if pending:
+                time.sleep(delay)
+                delay = min(delay * 2, 4.0)
+        
+        if pending:
+            logger.warning(f"  ⚠️ Processing timeout, {len(pending)} episode(s) still pending")
+        else:
+            logger.info(f"  ✅ Episodes processed in {time.time() - start:.1f} seconds")
     
     def create_fragile_master_graph(self) -> str:
         """Create a master graph with many interconnected, fragile relationships"""
-        print("\n" + "=" * 60)
-        print("CREATING FRAGILE MASTER GRAPH")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("CREATING FRAGILE MASTER GRAPH")
+        logger.info("=" * 60)
         
         master_id = f"fragile_master_{uuid.uuid4().hex[:8]}"
         master = self.client.graph.create(
@@ -41,282 +229,174 @@ class ZepCascadeImpactTester:
             name="Fragile Master Graph",
             description="Graph with interconnected fragile relationships"
         )
-        print(f"✅ Created master graph: {master_id}")
-        
-        # Episode 1: Company hierarchy and dependencies
-        print("\n📝 Episode 1: Company Structure")
-        company_structure = """
-        MegaCorp is the parent company that owns TechDivision, FinanceDivision, and RetailDivision.
-        TechDivision manages 500 employees and generates $100M revenue annually.
-        FinanceDivision manages 300 employees and generates $80M revenue annually.
-        RetailDivision manages 1000 employees and generates $200M revenue annually.
-        
-        John Smith is the CEO of MegaCorp since 2015.
-        Sarah Johnson is the CTO of TechDivision reporting to John Smith.
-        Michael Brown is the CFO of FinanceDivision reporting to John Smith.
-        Emily Davis is the COO of RetailDivision reporting to John Smith.
-        
-        All divisions are headquartered in Silicon Valley Campus.
-        The Silicon Valley Campus was established in 2010 and houses 1800 employees total.
-        """
-        
-        episode1 = self.client.graph.add(
-            graph_id=master_id,
-            type="text",
-            data=company_structure
-        )
-        print(f"  Added Episode 1: {episode1.uuid_}")
+        logger.info(f"✅ Created master graph: {master_id}")
         
-        # Episode 2: Product dependencies
-        print("\n📝 Episode 2: Product Ecosystem")
-        product_ecosystem = """
-        TechDivision develops CloudPlatform, which is used by FinanceDivision and RetailDivision.
-        CloudPlatform processes 10 million transactions daily across all divisions.
-        FinanceDivision's TradingSystem depends entirely on CloudPlatform for real-time processing.
-        RetailDivision's InventorySystem depends entirely on CloudPlatform for synchronization.
-        
-        CloudPlatform is maintained by the Platform Team led by Sarah Johnson.
-        The Platform Team consists of 50 engineers including Alex Chen, Lisa Wang, and David Lee.
-        Alex Chen is the lead architect of CloudPlatform's core infrastructure.
-        Lisa Wang manages CloudPlatform's security protocols.
-        David Lee oversees CloudPlatform's API integrations.
-        """
-        
-        episode2 = self.client.graph.add(
-            graph_id=master_id,
-            type="text",
-            data=product_ecosystem
-        )
-        print(f"  Added Episode 2: {episode2.uuid_}")
+        for number, (title, _) in enumerate(MASTER_EPISODES, 1):
+            logger.info(f"\n📝 Episode {number}: {title}")
         
-        # Episode 3: Financial relationships
-        print("\n📝 Episode 3: Financial Dependencies")
-        financial_deps = """
-        MegaCorp's total valuation is $2 billion based on combined division performance.
-        TechDivision's CloudPlatform generates $50M of its $100M revenue.
-        FinanceDivision pays TechDivision $10M annually for CloudPlatform usage.
-        RetailDivision pays TechDivision $15M annually for CloudPlatform usage.
+        # Send all five episodes in a single batch request
+        episodes = self.add_episodes(master_id, [text for _, text in MASTER_EPISODES])
+        for number, episode in enumerate(episodes, 1):
+            logger.info(f"  Added Episode {number}: {episode.uuid_}")
         
-        John Smith owns 30% of MegaCorp shares worth $600M.
-        Sarah Johnson owns 5% of MegaCorp shares worth $100M.
-        Michael Brown owns 3% of MegaCorp shares worth $60M.
-        Emily Davis owns 3% of MegaCorp shares worth $60M.
+        logger.info("\n⏳ Waiting for all episodes to process...")
+        self.wait_for_episodes([episode.uuid_ for episode in episodes])
         
-        MegaCorp's board includes John Smith, Sarah Johnson, and external directors.
-        The board meets quarterly at Silicon Valley Campus.
-        """
-        
-        episode3 = self.client.graph.add(
-            graph_id=master_id,
-            type="text",
-            data=financial_deps
-        )
-        print(f"  Added Episode 3: {episode3.uuid_}")
-        
-        # Episode 4: Strategic partnerships
-        print("\n📝 Episode 4: Strategic Relationships")
-        partnerships = """
-        MegaCorp has exclusive partnerships with CloudProvider Inc and DataAnalytics Corp.
-        CloudProvider Inc provides infrastructure for CloudPlatform at $5M annually.
-        DataAnalytics Corp processes all customer data for RetailDivision.
-        
-        John Smith serves on the board of CloudProvider Inc.
-        Sarah Johnson collaborates with CloudProvider Inc's technical team.
-        Michael Brown manages the financial relationship with DataAnalytics Corp.
-        
-        All three divisions depend on CloudProvider Inc's infrastructure.
-        CloudProvider Inc's CEO James Wilson meets monthly with John Smith.
-        The partnership agreements are reviewed annually by the board.
-        """
-        
-        episode4 = self.client.graph.add(
-            graph_id=master_id,
-            type="text",
-            data=partnerships
-        )
-        print(f"  Added Episode 4: {episode4.uuid_}")
-        
-        # Episode 5: Customer relationships
-        print("\n📝 Episode 5: Customer Dependencies")
-        customers = """
-        RetailDivision serves 1 million customers through CloudPlatform's e-commerce system.
-        FinanceDivision manages $500M in assets for 10,000 clients through TradingSystem.
-        TechDivision has 100 enterprise clients using CloudPlatform directly.
-        
-        BigRetailer is RetailDivision's largest customer generating $50M annually.
-        InvestmentFirm is FinanceDivision's largest client with $100M under management.
-        TechStartup is TechDivision's newest client paying $1M annually for CloudPlatform.
-        
-        Customer satisfaction depends on CloudPlatform's 99.9% uptime guarantee.
-        All customer data is stored in Silicon Valley Campus data centers.
-        """
-        
-        episode5 = self.client.graph.add(
-            graph_id=master_id,
-            type="text",
-            data=customers
-        )
-        print(f"  Added Episode 5: {episode5.uuid_}")
-        
-        print("\n⏳ Waiting for all episodes to process (20 seconds)...")
-        time.sleep(20)
-        
-        print("✅ Fragile master graph created with 5 interconnected episodes")
+        logger.info("✅ Fragile master graph created with 5 interconnected episodes")
         return master_id
     
     def create_disruptive_episode(self) -> str:
         """Create a small episode that will disrupt many relationships"""
-        print("\n" + "=" * 60)
-        print("CREATING DISRUPTIVE EPISODE")
-        print("=" * 60)
-        
-        # This small change will cascade through the graph
-        disruptive_data = """
-        BREAKING NEWS: As of today, John Smith has resigned as CEO of MegaCorp effective immediately.
-        Sarah Johnson has been appointed as the new CEO of MegaCorp.
-        Sarah Johnson is no longer CTO of TechDivision.
-        Alex Chen has been promoted to CTO of TechDivision replacing Sarah Johnson.
-        
-        MegaCorp is relocating headquarters from Silicon Valley Campus to Austin, Texas.
-        The Silicon Valley Campus will be closed by end of year.
-        CloudPlatform will be migrated to CloudProvider Inc's Texas datacenter.
-        """
-        
-        print("📝 Disruptive Episode Content:")
-        print("-" * 40)
-        for line in disruptive_data.strip().split('\n'):
-            if line.strip():
-                print(f"  • {line.strip()}")
-        
-        print("\n💥 This episode contains:")
-        print("  - 3 leadership changes")
-        print("  - 1 headquarters relocation")
-        print("  - 1 datacenter migration")
-        print("\n⚠️ Expected cascading impacts:")
-        print("  - Invalidates CEO/CTO relationships")
-        print("  - Affects all 'reporting to' edges")
-        print("  - Impacts location-based relationships")
-        print("  - Changes infrastructure dependencies")
-        print("  - Affects board composition")
-        print("  - Modifies shareholding contexts")
-        
-        return disruptive_data
+        logger.info("\n" + "=" * 60)
+        logger.info("CREATING DISRUPTIVE EPISODE")
+        logger.info("=" * 60)
+        
+        logger.info("📝 Disruptive Episode Content:")
+        logger.info("-" * 40)
+        for line in filter(None, (line.strip() for line in DISRUPTIVE_EPISODE.splitlines())):
+            logger.info(f"  • {line}")
+        
+        logger.info("\n💥 This episode contains:")
+        for item in DISRUPTION_CONTENTS:
+            logger.info(f"  - {item}")
+        logger.info("\n⚠️ Expected cascading impacts:")
+        for item in DISRUPTION_IMPACTS:
+            logger.info(f"  - {item}")
+        
+        return DISRUPTIVE_EPISODE
     
-    def analyze_graph_state(self, graph_id: str) -> Dict[str, Any]:
-        """Analyze the current state of a graph"""
-        entities = []
-        edges = []
-        
-        # Comprehensive search queries
-        search_queries = [
-            "John Smith Sarah Johnson CEO CTO MegaCorp TechDivision",
-            "CloudPlatform Silicon Valley Campus Austin Texas",
-            "Alex Chen Michael Brown Emily Davis divisions",
-            "revenue employees reporting headquarters",
-            "CloudProvider DataAnalytics partnerships board",
-            "customers clients TradingSystem InventorySystem"
-        ]
+    def analyze_graph_state(self, graph_id: str,
+                            baseline: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze the current state of a graph
+        
+        Returns a summary computed while the graph is enumerated: counts, uuid
+        sets, invalidated facts grouped by edge type and, when a baseline state
+        is given, the entities and valid edges missing from it. Full entity and
+        edge lists are not kept.
+        """
+        cache_key = (graph_id, baseline["graph_id"] if baseline else None)
+        if cache_key in self._state_cache:
+            return self._state_cache[cache_key]
+        
+        new_entities = []
+        new_edges = []
+        seen_entity_uuids = set()
+        seen_edge_uuids = set()
+        invalidated_by_type = defaultdict(list)
+        invalidated_count = 0
+        baseline_entity_uuids = baseline["entity_uuids"] if baseline else set()
+        baseline_edge_uuids = baseline["edge_uuids"] if baseline else set()
+        complete = False
         
         try:
-            # Search for entities
-            for query in search_queries:
-                node_results = self.client.graph.search(
-                    graph_id=graph_id,
-                    query=query,
-                    scope="nodes",
-                    limit=50
+            # Enumerate the whole graph with the paginated list endpoints
+            # rather than ranked semantic searches: one scan per scope, run
+            # side by side, instead of 6 overlapping queries per scope
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                nodes_future = executor.submit(
+                    list_all, self.client.graph.node.get_by_graph_id, graph_id
                 )
-                
-                if node_results.nodes:
-                    for node in node_results.nodes:
-                        node_uuid = node.uuid_ if hasattr(node, 'uuid_') else None
-                        if node_uuid and not any(e.get("uuid") == node_uuid for e in entities):
-                            entities.append({
-                                "uuid": node_uuid,
-                                "name": node.name if hasattr(node, 'name') else "Unknown",
-                                "type": node.labels[-1] if hasattr(node, 'labels') and node.labels else "Entity"
-                            })
-            
-            # Search for edges
-            for query in search_queries:
-                edge_results = self.client.graph.search(
-                    graph_id=graph_id,
-                    query=query,
-                    scope="edges",
-                    limit=50
+                edges_future = executor.submit(
+                    list_all, self.client.graph.edge.get_by_graph_id, graph_id
                 )
-                
-                if edge_results.edges:
-                    for edge in edge_results.edges:
-                        edge_uuid = edge.uuid_ if hasattr(edge, 'uuid_') else None
-                        if edge_uuid and not any(e.get("uuid") == edge_uuid for e in edges):
-                            edges.append({
-                                "uuid": edge_uuid,
-                                "fact": edge.fact if hasattr(edge, 'fact') else "Unknown",
-                                "type": edge.name if hasattr(edge, 'name') else "RELATES_TO",
-                                "invalid_at": edge.invalid_at if hasattr(edge, 'invalid_at') else None
-                            })
+                nodes = nodes_future.result()
+                graph_edges = edges_future.result()
+            
+            # Collect entities
+            for node in nodes:
+                node_uuid = getattr(node, 'uuid_', None)
+                if not node_uuid or node_uuid in seen_entity_uuids:
+                    continue
+                seen_entity_uuids.add(node_uuid)
+                if baseline and node_uuid not in baseline_entity_uuids:
+                    labels = getattr(node, 'labels', None)
+                    new_entities.append(EntityRec(
+                        node_uuid, getattr(node, 'name', "Unknown"),
+                        labels[-1] if labels else "Entity"
+                    ))
+            
+            # Collect edges
+            for edge in graph_edges:
+                edge_uuid = getattr(edge, 'uuid_', None)
+                if not edge_uuid or edge_uuid in seen_edge_uuids:
+                    continue
+                seen_edge_uuids.add(edge_uuid)
+                invalid_at = getattr(edge, 'invalid_at', None)
+                if invalid_at is not None:
+                    invalidated_count += 1
+                    invalidated_by_type[getattr(edge, 'name', "RELATES_TO")].append(
+                        getattr(edge, 'fact', "Unknown")
+                    )
+                elif baseline and edge_uuid not in baseline_edge_uuids:
+                    new_edges.append(EdgeRec(
+                        edge_uuid, getattr(edge, 'fact', "Unknown"),
+                        getattr(edge, 'name', "RELATES_TO"), invalid_at
+                    ))
+            complete = True
         
         except Exception as e:
-            print(f"⚠️ Error analyzing graph: {e}")
-        
-        # Count invalidated edges
-        invalidated_edges = [e for e in edges if e.get("invalid_at") is not None]
+            logger.warning(f"⚠️ Error analyzing graph: {e}")
         
-        return {
+        state = {
             "graph_id": graph_id,
-            "entity_count": len(entities),
-            "edge_count": len(edges),
-            "invalidated_edge_count": len(invalidated_edges),
-            "entities": entities,
-            "edges": edges,
-            "invalidated_edges": invalidated_edges
+            "entity_count": len(seen_entity_uuids),
+            "edge_count": len(seen_edge_uuids),
+            "invalidated_edge_count": invalidated_count,
+            "invalidated_facts_by_type": dict(invalidated_by_type),
+            "entity_uuids": seen_entity_uuids,
+            "edge_uuids": seen_edge_uuids,
+            "new_entities": new_entities,
+            "new_edges": new_edges
         }
+        # A failed scan leaves a partial state; never reuse it as a baseline
+        if complete:
+            self._state_cache[cache_key] = state
+        return state
     
     def run_cascade_test(self):
         """Run the complete cascade impact test"""
-        print("\n" + "=" * 60)
-        print("CASCADE IMPACT TEST")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("CASCADE IMPACT TEST")
+        logger.info("=" * 60)
         
         # Step 1: Create fragile master
         master_id = self.create_fragile_master_graph()
         
-        # Analyze master state
-        print("\n📊 Analyzing Master Graph State...")
-        master_state = self.analyze_graph_state(master_id)
-        print(f"  Master: {master_state['entity_count']} entities, {master_state['edge_count']} edges")
-        
-        # Step 2: Create disruptive episode
-        disruptive_data = self.create_disruptive_episode()
-        
-        # Step 3: Clone master
-        print("\n📋 Cloning master graph...")
+        # Step 2: Clone master
+        logger.info("\n📋 Cloning master graph...")
         copy_id = f"{master_id}_copy"
         result = self.client.graph.clone(
             source_graph_id=master_id,
             target_graph_id=copy_id
         )
-        print(f"✅ Created copy: {copy_id}")
-        
-        # Step 4: Apply disruptive episode to copy
-        print("\n💥 Applying disruptive episode to copy...")
-        episode = self.client.graph.add(
-            graph_id=copy_id,
-            type="text",
-            data=disruptive_data
-        )
-        print(f"  Episode UUID: {episode.uuid_}")
+        logger.info(f"✅ Created copy: {copy_id}")
         
-        # Wait for processing
-        print("⏳ Waiting for cascade effects to process (20 seconds)...")
-        time.sleep(20)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The master no longer changes, so analyze it in the background
+            # while the copy is disrupted and processed
+            master_future = executor.submit(self.analyze_graph_state, master_id)
+            
+            # Step 3: Create disruptive episode
+            disruptive_data = self.create_disruptive_episode()
+            
+            # Step 4: Apply disruptive episode to copy
+            logger.info("\n💥 Applying disruptive episode to copy...")
+            episode = self.add_episode(copy_id, disruptive_data)
+            logger.info(f"  Episode UUID: {episode.uuid_}")
+            
+            # Wait for processing
+            logger.info("⏳ Waiting for cascade effects to process...")
+            self.wait_for_episodes([episode.uuid_])
+            
+            logger.info("\n📊 Analyzing Master Graph State...")
+            master_state = master_future.result()
+            logger.info(f"  Master: {master_state['entity_count']} entities, {master_state['edge_count']} edges")
         
         # Step 5: Analyze copy state
-        print("\n📊 Analyzing Copy Graph State...")
-        copy_state = self.analyze_graph_state(copy_id)
-        print(f"  Copy: {copy_state['entity_count']} entities, {copy_state['edge_count']} edges")
-        print(f"  Invalidated edges: {copy_state['invalidated_edge_count']}")
+        logger.info("\n📊 Analyzing Copy Graph State...")
+        copy_state = self.analyze_graph_state(copy_id, baseline=master_state)
+        logger.info(f"  Copy: {copy_state['entity_count']} entities, {copy_state['edge_count']} edges")
+        logger.info(f"  Invalidated edges: {copy_state['invalidated_edge_count']}")
         
         # Step 6: Compare and show impact
         self.show_cascade_impact(master_state, copy_state)
@@ -325,100 +405,94 @@ class ZepCascadeImpactTester:
     
     def show_cascade_impact(self, master_state: Dict, copy_state: Dict):
         """Display the cascading impact analysis"""
-        print("\n" + "=" * 60)
-        print("CASCADE IMPACT ANALYSIS")
-        print("=" * 60)
+        # Build the report up front and write it in one call
+        lines = []
+        lines.append("\n" + "=" * 60)
+        lines.append("CASCADE IMPACT ANALYSIS")
+        lines.append("=" * 60)
         
         # Calculate changes
         entity_change = copy_state['entity_count'] - master_state['entity_count']
         edge_change = copy_state['edge_count'] - master_state['edge_count']
         
-        print(f"\n📊 QUANTITATIVE IMPACT")
-        print("-" * 40)
-        print(f"Entities: {master_state['entity_count']} → {copy_state['entity_count']} ({entity_change:+d})")
-        print(f"Edges: {master_state['edge_count']} → {copy_state['edge_count']} ({edge_change:+d})")
-        print(f"Invalidated Edges: 0 → {copy_state['invalidated_edge_count']}")
+        lines.append(f"\n📊 QUANTITATIVE IMPACT")
+        lines.append("-" * 40)
+        lines.append(f"Entities: {master_state['entity_count']} → {copy_state['entity_count']} ({entity_change:+d})")
+        lines.append(f"Edges: {master_state['edge_count']} → {copy_state['edge_count']} ({edge_change:+d})")
+        lines.append(f"Invalidated Edges: 0 → {copy_state['invalidated_edge_count']}")
         
-        # Find new entities
-        master_uuids = {e['uuid'] for e in master_state['entities']}
-        new_entities = [e for e in copy_state['entities'] if e['uuid'] not in master_uuids]
+        # New entities were collected against the master during analysis
+        new_entities = copy_state['new_entities']
         
         if new_entities:
-            print(f"\n🆕 NEW ENTITIES ({len(new_entities)})")
-            print("-" * 40)
+            lines.append(f"\n🆕 NEW ENTITIES ({len(new_entities)})")
+            lines.append("-" * 40)
             for entity in new_entities[:10]:
-                print(f"  • {entity['name']} ({entity['type']})")
+                lines.append(f"  • {entity.name} ({entity.type})")
         
         # Show invalidated relationships
-        if copy_state['invalidated_edges']:
-            print(f"\n❌ INVALIDATED RELATIONSHIPS ({len(copy_state['invalidated_edges'])})")
-            print("-" * 40)
-            
-            # Group by type
-            by_type = {}
-            for edge in copy_state['invalidated_edges']:
-                edge_type = edge['type']
-                if edge_type not in by_type:
-                    by_type[edge_type] = []
-                by_type[edge_type].append(edge['fact'])
+        if copy_state['invalidated_edge_count']:
+            lines.append(f"\n❌ INVALIDATED RELATIONSHIPS ({copy_state['invalidated_edge_count']})")
+            lines.append("-" * 40)
             
-            for edge_type, facts in by_type.items():
-                print(f"\n  {edge_type} ({len(facts)} invalidated):")
+            # Facts were grouped by edge type during analysis
+            for edge_type, facts in copy_state['invalidated_facts_by_type'].items():
+                lines.append(f"\n  {edge_type} ({len(facts)} invalidated):")
                 for fact in facts[:3]:
-                    print(f"    • {fact[:80]}...")
+                    lines.append(f"    • {_truncate(fact)}")
         
         # Find new edges
-        master_edge_uuids = {e['uuid'] for e in master_state['edges']}
-        new_edges = [e for e in copy_state['edges'] 
-                    if e['uuid'] not in master_edge_uuids and not e.get('invalid_at')]
+        new_edges = copy_state['new_edges']
         
         if new_edges:
-            print(f"\n✅ NEW RELATIONSHIPS ({len(new_edges)})")
-            print("-" * 40)
+            lines.append(f"\n✅ NEW RELATIONSHIPS ({len(new_edges)})")
+            lines.append("-" * 40)
             for edge in new_edges[:10]:
-                fact = edge['fact'][:80] + "..." if len(edge['fact']) > 80 else edge['fact']
-                print(f"  • {edge['type']}: {fact}")
+                lines.append(f"  • {edge.type}: {_truncate(edge.fact)}")
         
         # Calculate amplification factor
-        print(f"\n📈 AMPLIFICATION METRICS")
-        print("-" * 40)
-        print(f"Input: ~7 facts in disruptive episode")
-        print(f"Output: {copy_state['invalidated_edge_count']} invalidated edges")
+        lines.append(f"\n📈 AMPLIFICATION METRICS")
+        lines.append("-" * 40)
+        lines.append(f"Input: ~7 facts in disruptive episode")
+        lines.append(f"Output: {copy_state['invalidated_edge_count']} invalidated edges")
         if copy_state['invalidated_edge_count'] > 0:
             amplification = copy_state['invalidated_edge_count'] / 7
-            print(f"Amplification Factor: {amplification:.1f}x")
+            lines.append(f"Amplification Factor: {amplification:.1f}x")
         
-        print(f"\n💡 CONCLUSION")
-        print("-" * 40)
-        print(f"A small episode with leadership and location changes cascaded through")
-        print(f"the graph, affecting {copy_state['invalidated_edge_count']} relationships and creating {len(new_entities)} new entities.")
-        print(f"This demonstrates how interconnected 'fragile' relationships can")
-        print(f"amplify the impact of seemingly minor changes.")
+        lines.append(f"\n💡 CONCLUSION")
+        lines.append("-" * 40)
+        lines.append(f"A small episode with leadership and location changes cascaded through")
+        lines.append(f"the graph, affecting {copy_state['invalidated_edge_count']} relationships and creating {len(new_entities)} new entities.")
+        lines.append(f"This demonstrates how interconnected 'fragile' relationships can")
+        lines.append(f"amplify the impact of seemingly minor changes.")
+        
+        logger.info("\n".join(lines))
+
 
 def main():
     """Run the cascade impact demonstration"""
-    print("=" * 60)
-    print("ZEP CASCADE IMPACT DEMONSTRATION")
-    print("=" * 60)
-    print("\nThis test will demonstrate how small changes can have")
-    print("large cascading effects in interconnected graphs.")
+    logger.info("=" * 60)
+    logger.info("ZEP CASCADE IMPACT DEMONSTRATION")
+    logger.info("=" * 60)
+    logger.info("\nThis test will demonstrate how small changes can have")
+    logger.info("large cascading effects in interconnected graphs.")
     
     tester = ZepCascadeImpactTester()
     
     # Run the test
     master_id, copy_id, master_state, copy_state = tester.run_cascade_test()
     
-    print("\n" + "=" * 60)
-    print("TEST COMPLETE")
-    print("=" * 60)
-    print(f"\n📋 Summary:")
-    print(f"  Master Graph: {master_id}")
-    print(f"  Copy Graph: {copy_id}")
-    print(f"  Entities Created: {master_state['entity_count']}")
-    print(f"  Relationships Affected: {copy_state['invalidated_edge_count']}")
+    logger.info("\n" + "=" * 60)
+    logger.info("TEST COMPLETE")
+    logger.info("=" * 60)
+    logger.info(f"\n📋 Summary:")
+    logger.info(f"  Master Graph: {master_id}")
+    logger.info(f"  Copy Graph: {copy_id}")
+    logger.info(f"  Entities Created: {master_state['entity_count']}")
+    logger.info(f"  Relationships Affected: {copy_state['invalidated_edge_count']}")
     
     return master_id, copy_id
 
 if __name__ == "__main__":
     master_id, copy_id = main()
-    print(f"\n✅ Cascade impact test complete!")
\ No newline at end of file
+    logger.info(f"\n✅ Cascade impact test complete!")
\ No newline at end of file
@@ -8,22 +8,34 @@ This module implements a safer impact assessment approach using graph cloning:
 """
 
 import os
-import uuid
+import secrets
 import json
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
+import httpx
 from dotenv import load_dotenv
-from zep_cloud.client import Zep
+from zep_cloud.core.api_error import ApiError
 from zep_cloud.types import Message
+from zep_common import flush_log, get_logger, get_zep, list_all
 from dataclasses import dataclass, field
 
 # Load environment variables
 load_dotenv()
 
+logger = get_logger(__name__)
+
 @dataclass
 class GraphComparison:
     """Results of comparing two graphs"""
+    __slots__ = (
+        "master_id", "copy_id", "master_entities", "copy_entities",
+        "master_edges", "copy_edges", "entities_added", "edges_added",
+        "entities_modified", "edges_modified", "processing_time"
+    )
+    
     master_id: str
     copy_id: str
     master_entities: List[Dict[str, Any]]
@@ -61,130 +73,163 @@ class GraphComparison:
 class ZepCloneImpactAssessor:
     """Impact assessment using graph cloning strategy"""
     
+    # Clone records kept for auditing before the oldest are dropped
+    MAX_TRACKED_CLONES = 256
+    
     def __init__(self):
         """Initialize Zep client"""
         api_key = os.getenv('ZEP_API_KEY')
         if not api_key or api_key == 'your_zep_api_key_here':
             raise ValueError("Please set your ZEP_API_KEY in the .env file")
         
-        self.client = Zep(api_key=api_key)
-        print("✅ Connected to Zep Clone Impact Assessor")
+        self.client = get_zep(api_key)
+        logger.info("✅ Connected to Zep Clone Impact Assessor")
+        
+        # Clone records in creation order; approve/reject update the status
+        # ("active", "approved", "rejected", "archived") instead of deleting
+        self.active_clones: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Logical graph (the original master id) -> graph currently serving it
+        self.master_pointer: Dict[str, str] = {}
+        
+        # get_graph_contents results keyed by (graph or user id, is_user)
+        self._content_cache: Dict[Tuple[str, bool], Tuple[List, List]] = {}
         
-        # Track active clones for cleanup
-        self.active_clones = {}
+        # Shared entity/edge dicts keyed by their field values, so a node seen
+        # unchanged in both master and copy is held once
+        self._node_pool: Dict[Tuple, Dict[str, Any]] = {}
+        self._edge_pool: Dict[Tuple, Dict[str, Any]] = {}
+    
+    def _invalidate_contents(self, *ids: str):
+        """Drop cached contents for the given graph or user ids"""
+        for key in list(self._content_cache):
+            if key[0] in ids:
+                del self._content_cache[key]
+        
+        # Keep only pooled dicts still referenced by a cached graph
+        self._node_pool = {
+            tuple(e.values()): e
+            for entities, _ in self._content_cache.values() for e in entities
+        }
+        self._edge_pool = {
+            tuple(e.values()): e
+            for _, edges in self._content_cache.values() for e in edges
+        }
+    
+    def _track_clone(self, copy_id: str, clone_type: str, source_id: str):
+        """Record a new clone, evicting the oldest records past the cap"""
+        source = self.active_clones.get(source_id)
+        self.active_clones[copy_id] = {
+            "type": clone_type,
+            "source": source_id,
+            "root": source["root"] if source else source_id,
+            "status": "active",
+            "created_at": datetime.now()
+        }
+        while len(self.active_clones) > self.MAX_TRACKED_CLONES:
+            self.active_clones.popitem(last=False)
+    
+    def current_master(self, graph_id: str) -> str:
+        """Return the graph currently serving a logical graph"""
+        return self.master_pointer.get(graph_id, graph_id)
     
     def clone_graph(self, source_graph_id: str = None, source_user_id: str = None) -> str:
         """Clone a graph and return the copy ID"""
         try:
             if source_graph_id:
                 # Clone regular graph
-                copy_id = f"{source_graph_id}_copy_{uuid.uuid4().hex[:6]}"
+                copy_id = f"{source_graph_id}_copy_{secrets.token_hex(3)}"
                 result = self.client.graph.clone(
                     source_graph_id=source_graph_id,
                     target_graph_id=copy_id
                 )
-                print(f"✅ Cloned graph {source_graph_id} to {copy_id}")
-                self.active_clones[copy_id] = {
-                    "type": "graph",
-                    "source": source_graph_id,
-                    "created_at": datetime.now()
-                }
+                logger.info(f"✅ Cloned graph {source_graph_id} to {copy_id}")
+                self._track_clone(copy_id, "graph", source_graph_id)
                 return copy_id
             elif source_user_id:
                 # Clone user graph
-                copy_id = f"{source_user_id}_copy_{uuid.uuid4().hex[:6]}"
+                copy_id = f"{source_user_id}_copy_{secrets.token_hex(3)}"
                 result = self.client.graph.clone(
                     source_user_id=source_user_id,
                     target_user_id=copy_id
                 )
-                print(f"✅ Cloned user {source_user_id} to {copy_id}")
-                self.active_clones[copy_id] = {
-                    "type": "user",
-                    "source": source_user_id,
-                    "created_at": datetime.now()
-                }
+                logger.info(f"✅ Cloned user {source_user_id} to {copy_id}")
+                self._track_clone(copy_id, "user", source_user_id)
                 return copy_id
         except Exception as e:
-            print(f"❌ Error cloning graph: {e}")
+            logger.warning(f"❌ Error cloning graph: {e}")
             return None
     
     def get_graph_contents(self, graph_id: str = None, user_id: str = None) -> Tuple[List, List]:
-        """Get all entities and edges from a graph"""
-        entities = []
-        edges = []
+        """Get all entities and edges from a graph, cached per graph or user"""
+        cache_key = (graph_id or user_id, not graph_id)
+        if cache_key in self._content_cache:
+            return self._content_cache[cache_key]
+        
+        entities_by_uuid = {}
+        edges_by_uuid = {}
+        if graph_id:
+            owner_id = graph_id
+            list_nodes = self.client.graph.node.get_by_graph_id
+            list_edges = self.client.graph.edge.get_by_graph_id
+        else:
+            owner_id = user_id
+            list_nodes = self.client.graph.node.get_by_user_id
+            list_edges = self.client.graph.edge.get_by_user_id
+        complete = False
         
         try:
-            # Search for entities - use specific terms from our data
-            search_queries = [
-                "Acme Corporation John Smith CEO StartupXYZ Sarah Johnson",
-                "technology company employees San Francisco acquisition",
-                "founded million AI capabilities TechConf"
-            ]
-            
-            for query in search_queries:
-                if graph_id:
-                    node_results = self.client.graph.search(
-                        graph_id=graph_id,
-                        query=query,
-                        scope="nodes",
-                        limit=50
-                    )
-                else:
-                    node_results = self.client.graph.search(
-                        user_id=user_id,
-                        query=query,
-                        scope="nodes",
-                        limit=50
-                    )
+            # Enumerate the whole graph with the paginated list endpoints;
+            # the node and edge scans run side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                nodes_future = executor.submit(list_all, list_nodes, owner_id)
+                edges_future = executor.submit(list_all, list_edges, owner_id)
                 
-                if node_results.nodes:
-                    for node in node_results.nodes:
-                        # Check if we already have this node
-                        node_uuid = node.uuid_ if hasattr(node, 'uuid_') else None
-                        if node_uuid and not any(e.get("uuid") == node_uuid for e in entities):
-                            entities.append({
-                                "uuid": node_uuid,
-                                "name": node.name if hasattr(node, 'name') else "Unknown",
-                                "type": node.labels[-1] if hasattr(node, 'labels') and node.labels else "Entity",
-                                "summary": node.summary if hasattr(node, 'summary') else None
-                            })
-            
-            # Search for edges
-            for query in search_queries:
-                if graph_id:
-                    edge_results = self.client.graph.search(
-                        graph_id=graph_id,
-                        query=query,
-                        scope="edges",
-                        limit=50
-                    )
-                else:
-                    edge_results = self.client.graph.search(
-                        user_id=user_id,
-                        query=query,
-                        scope="edges",
-                        limit=50
-                    )
+                for node in nodes_future.result():
+                    node_uuid = node.uuid_ if hasattr(node, 'uuid_') else None
+                    if node_uuid and node_uuid not in entities_by_uuid:
+                        fields = (
+                            node_uuid,
+                            node.name if hasattr(node, 'name') else "Unknown",
+                            node.labels[-1] if hasattr(node, 'labels') and node.labels else "Entity",
+                            node.summary if hasattr(node, 'summary') else None
+                        )
+                        entity = self._node_pool.get(fields)
+                        if entity is None:
+                            entity = self._node_pool[fields] = dict(
+                                zip(("uuid", "name", "type", "summary"), fields)
+                            )
+                        entities_by_uuid[node_uuid] = entity
                 
-                if edge_results.edges:
-                    for edge in edge_results.edges:
-                        edge_uuid = edge.uuid_ if hasattr(edge, 'uuid_') else None
-                        if edge_uuid and not any(e.get("uuid") == edge_uuid for e in edges):
-                            edges.append({
-                                "uuid": edge_uuid,
-                                "fact": edge.fact if hasattr(edge, 'fact') else "Unknown",
-                                "type": edge.name if hasattr(edge, 'name') else "RELATES_TO",
-                                "valid_at": edge.valid_at if hasattr(edge, 'valid_at') else None
-                            })
+                for edge in edges_future.result():
+                    edge_uuid = edge.uuid_ if hasattr(edge, 'uuid_') else None
+                    if edge_uuid and edge_uuid not in edges_by_uuid:
+                        fields = (
+                            edge_uuid,
+                            edge.fact if hasattr(edge, 'fact') else "Unknown",
+                            edge.name if hasattr(edge, 'name') else "RELATES_TO",
+                            edge.valid_at if hasattr(edge, 'valid_at') else None
+                        )
+                        edge_dict = self._edge_pool.get(fields)
+                        if edge_dict is None:
+                            edge_dict = self._edge_pool[fields] = dict(
+                                zip(("uuid", "fact", "type", "valid_at"), fields)
+                            )
+                        edges_by_uuid[edge_uuid] = edge_dict
+            complete = True
             
         except Exception as e:
-            print(f"⚠️ Error getting graph contents: {e}")
+            logger.warning(f"⚠️ Error getting graph contents: {e}")
         
-        return entities, edges
+        contents = list(entities_by_uuid.values()), list(edges_by_uuid.values())
+        # A failed scan leaves partial contents; never reuse them in a compare
+        if complete:
+            self._content_cache[cache_key] = contents
+        return contents
     
     def compare_graphs(self, master_id: str, copy_id: str, is_user: bool = False) -> GraphComparison:
         """Compare master and copy graphs to identify differences"""
-        print(f"\n🔍 Comparing graphs: {master_id} vs {copy_id}")
+        logger.info(f"\n🔍 Comparing graphs: {master_id} vs {copy_id}")
         
         # Get contents of both graphs
         if is_user:
@@ -194,47 +239,47 @@ class ZepCloneImpactAssessor:
             master_entities, master_edges = self.get_graph_contents(graph_id=master_id)
             copy_entities, copy_edges = self.get_graph_contents(graph_id=copy_id)
         
-        print(f"  Master: {len(master_entities)} entities, {len(master_edges)} edges")
-        print(f"  Copy: {len(copy_entities)} entities, {len(copy_edges)} edges")
+        logger.info("  Master: %d entities, %d edges", len(master_entities), len(master_edges))
+        logger.info("  Copy: %d entities, %d edges", len(copy_entities), len(copy_edges))
         
-        # Find differences
-        master_entity_uuids = {e["uuid"] for e in master_entities if e.get("uuid")}
-        copy_entity_uuids = {e["uuid"] for e in copy_entities if e.get("uuid")}
+        # Index both sides by uuid; added/shared uuids then come from
+        # set operations on the key views rather than per-item lookups
+        master_entity_index = {e["uuid"]: e for e in master_entities if e.get("uuid")}
+        master_edge_index = {e["uuid"]: e for e in master_edges if e.get("uuid")}
+        copy_entity_index = {e["uuid"]: e for e in copy_entities if e.get("uuid")}
+        copy_edge_index = {e["uuid"]: e for e in copy_edges if e.get("uuid")}
         
-        master_edge_uuids = {e["uuid"] for e in master_edges if e.get("uuid")}
-        copy_edge_uuids = {e["uuid"] for e in copy_edges if e.get("uuid")}
+        new_entity_uuids = copy_entity_index.keys() - master_entity_index.keys()
+        new_edge_uuids = copy_edge_index.keys() - master_edge_index.keys()
         
-        # New entities in copy
-        entities_added = [e for e in copy_entities 
-                         if e.get("uuid") and e["uuid"] not in master_entity_uuids]
-        
-        # Modified entities
+        # New and modified entities in copy (pooled dicts that are the same
+        # object are unchanged and skip the field comparison)
+        entities_added = []
         entities_modified = []
-        for copy_entity in copy_entities:
-            if copy_entity.get("uuid") in master_entity_uuids:
-                master_entity = next((e for e in master_entities 
-                                     if e.get("uuid") == copy_entity["uuid"]), None)
-                if master_entity and master_entity.get("summary") != copy_entity.get("summary"):
-                    entities_modified.append({
-                        "entity": copy_entity,
-                        "change": "summary_updated"
-                    })
-        
-        # New edges in copy
-        edges_added = [e for e in copy_edges 
-                      if e.get("uuid") and e["uuid"] not in master_edge_uuids]
-        
-        # Modified edges
+        for entity_uuid, copy_entity in copy_entity_index.items():
+            if entity_uuid in new_entity_uuids:
+                entities_added.append(copy_entity)
+                continue
+            master_entity = master_entity_index[entity_uuid]
+            if master_entity is not copy_entity and master_entity.get("summary") != copy_entity.get("summary"):
+                entities_modified.append({
+                    "entity": copy_entity,
+                    "change": "summary_updated"
+                })
+        
+        # New and modified edges in copy
+        edges_added = []
         edges_modified = []
-        for copy_edge in copy_edges:
-            if copy_edge.get("uuid") in master_edge_uuids:
-                master_edge = next((e for e in master_edges 
-                                   if e.get("uuid") == copy_edge["uuid"]), None)
-                if master_edge and master_edge != copy_edge:
-                    edges_modified.append({
-                        "edge": copy_edge,
-                        "change": "modified"
-                    })
+        for edge_uuid, copy_edge in copy_edge_index.items():
+            if edge_uuid in new_edge_uuids:
+                edges_added.append(copy_edge)
+                continue
+            master_edge = master_edge_index[edge_uuid]
+            if master_edge is not copy_edge and master_edge != copy_edge:
+                edges_modified.append({
+                    "edge": copy_edge,
+                    "change": "modified"
+                })
         
         return GraphComparison(
             master_id=master_id,
@@ -256,12 +301,12 @@ class ZepCloneImpactAssessor:
         """Assess impact using clone strategy"""
         start_time = time.time()
         
-        print("\n" + "=" * 60)
-        print("CLONE-BASED IMPACT ASSESSMENT")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("CLONE-BASED IMPACT ASSESSMENT")
+        logger.info("=" * 60)
         
         # Step 1: Clone the graph
-        print("\n📋 Step 1: Cloning graph...")
+        logger.info("\n📋 Step 1: Cloning graph...")
         if graph_id:
             copy_id = self.clone_graph(source_graph_id=graph_id)
             master_id = graph_id
@@ -275,14 +320,15 @@ class ZepCloneImpactAssessor:
             if messages and thread_id:
                 copy_thread_id = f"{thread_id}_copy"
                 self.client.thread.create(thread_id=copy_thread_id, user_id=copy_id)
-                print(f"  Created thread for copy user: {copy_thread_id}")
+                logger.info(f"  Created thread for copy user: {copy_thread_id}")
         
         if not copy_id:
-            print("❌ Failed to create clone")
+            logger.warning("❌ Failed to create clone")
             return None
         
         # Step 2: Add data to the copy
-        print(f"\n📝 Step 2: Adding data to copy graph...")
+        logger.info("\n📝 Step 2: Adding data to copy graph...")
+        self._invalidate_contents(copy_id)
         if graph_id and data:
             # Add data to graph copy
             episode = self.client.graph.add(
@@ -291,49 +337,60 @@ class ZepCloneImpactAssessor:
                 data=data
             )
             episode_uuid = episode.uuid_ if hasattr(episode, 'uuid_') else None
-            print(f"  Added episode: {episode_uuid}")
+            logger.info(f"  Added episode: {episode_uuid}")
             
             # Wait for processing
-            print("⏳ Waiting for processing...")
+            logger.info("⏳ Waiting for processing...")
             if episode_uuid:
                 self.wait_for_episode(episode_uuid)
             else:
+                flush_log()
                 time.sleep(10)
                 
         elif user_id and messages:
             # Add messages to user copy
             self.client.thread.add_messages(copy_thread_id, messages=messages)
-            print(f"  Added {len(messages)} messages")
+            logger.info(f"  Added {len(messages)} messages")
             
             # Wait for processing
-            print("⏳ Waiting for processing...")
+            logger.info("⏳ Waiting for processing...")
+            flush_log()
             time.sleep(10)
         
         # Step 3: Compare graphs
-        print(f"\n🔄 Step 3: Comparing master vs copy...")
+        logger.info("\n🔄 Step 3: Comparing master vs copy...")
         comparison = self.compare_graphs(master_id, copy_id, is_user)
         comparison.processing_time = time.time() - start_time
         
         return comparison
     
     def wait_for_episode(self, episode_uuid: str, max_wait: int = 30):
-        """Wait for episode to be processed"""
+        """Wait for episode to be processed, polling with exponential backoff"""
+        flush_log()
         start = time.time()
+        delay = 0.5
         while time.time() - start < max_wait:
             try:
                 episode = self.client.graph.episode.get(uuid_=episode_uuid)
                 if episode.processed:
-                    print(f"  ✅ Episode processed")
+                    logger.info("  ✅ Episode processed")
                     return
-            except:
+            except ApiError as e:
+                # A just-added episode may not be visible yet; anything else
+                # (auth, bad request, server errors) will not fix itself
+                if e.status_code != 404:
+                    raise
+            except httpx.ReadTimeout:
+                # A slow poll is not a failure; try again on the next tick
                 pass
-            time.sleep(2)
-        print(f"  ⚠️ Processing timeout")
+            time.sleep(min(delay, max(0, max_wait - (time.time() - start))))
+            delay = min(delay * 2, 4.0)
+        logger.warning("  ⚠️ Processing timeout")
     
     def approve_changes(self, comparison: GraphComparison) -> bool:
         """Approve changes by making copy the new master"""
-        print("\n✅ APPROVING CHANGES")
-        print("-" * 40)
+        logger.info("\n✅ APPROVING CHANGES")
+        logger.info("-" * 40)
         
         # Note: Zep doesn't have a way to "swap" graphs or delete the master
         # In production, you would:
@@ -341,90 +398,106 @@ class ZepCloneImpactAssessor:
         # 2. Mark master as deprecated/archived
         # 3. Update all references to point to copy_id
         
-        print(f"  Copy graph {comparison.copy_id} is now the active graph")
-        print(f"  Original graph {comparison.master_id} should be archived")
-        
-        # Remove from active clones
-        if comparison.copy_id in self.active_clones:
-            del self.active_clones[comparison.copy_id]
+        logger.info(f"  Copy graph {comparison.copy_id} is now the active graph")
+        logger.info(f"  Original graph {comparison.master_id} should be archived")
+        
+        # Point the logical graph at the copy and archive the old master if
+        # it was itself a clone; the master is superseded, so drop its cached
+        # contents along with the copy's
+        record = self.active_clones.get(comparison.copy_id)
+        if record:
+            record["status"] = "approved"
+            record["approved_at"] = datetime.now()
+            self.master_pointer[record["root"]] = comparison.copy_id
+        master_record = self.active_clones.get(comparison.master_id)
+        if master_record:
+            master_record["status"] = "archived"
+        self._invalidate_contents(comparison.master_id, comparison.copy_id)
         
         return True
     
     def reject_changes(self, comparison: GraphComparison) -> bool:
         """Reject changes by deleting the copy"""
-        print("\n❌ REJECTING CHANGES")
-        print("-" * 40)
+        logger.info("\n❌ REJECTING CHANGES")
+        logger.info("-" * 40)
         
         # Note: Since Zep doesn't have graph.delete, we would:
         # 1. Stop using the copy_id
         # 2. Let it remain but mark as rejected
         # 3. Continue using master_id
         
-        print(f"  Abandoning copy graph {comparison.copy_id}")
-        print(f"  Continuing with master graph {comparison.master_id}")
+        logger.info(f"  Abandoning copy graph {comparison.copy_id}")
+        logger.info(f"  Continuing with master graph {comparison.master_id}")
         
-        # Remove from active clones
-        if comparison.copy_id in self.active_clones:
-            del self.active_clones[comparison.copy_id]
+        # Mark the clone rejected; the master's cached contents stay valid
+        record = self.active_clones.get(comparison.copy_id)
+        if record:
+            record["status"] = "rejected"
+            record["rejected_at"] = datetime.now()
+        self._invalidate_contents(comparison.copy_id)
         
         return True
     
     def print_comparison_report(self, comparison: GraphComparison):
-        """Print detailed comparison report"""
-        print("\n" + "=" * 60)
-        print("COMPARISON REPORT")
-        print("=" * 60)
-        
+        """Print detailed comparison report as a single log message"""
         summary = comparison.get_summary()
-        
-        print(f"\nMaster Graph: {summary['master_graph']}")
-        print(f"Copy Graph: {summary['copy_graph']}")
-        print(f"Processing Time: {summary['processing_time']}")
-        
-        print("\n📊 ENTITY CHANGES")
-        print("-" * 40)
-        changes = summary['changes']['entities']
-        print(f"Master: {changes['master_count']} entities")
-        print(f"Copy: {changes['copy_count']} entities")
-        print(f"Added: {changes['added']} new entities")
-        print(f"Modified: {changes['modified']} entities")
+        entity_changes = summary['changes']['entities']
+        edge_changes = summary['changes']['edges']
+        
+        lines = [
+            "\n" + "=" * 60,
+            "COMPARISON REPORT",
+            "=" * 60,
+            f"\nMaster Graph: {summary['master_graph']}",
+            f"Copy Graph: {summary['copy_graph']}",
+            f"Processing Time: {summary['processing_time']}",
+            "\n📊 ENTITY CHANGES",
+            "-" * 40,
+            f"Master: {entity_changes['master_count']} entities",
+            f"Copy: {entity_changes['copy_count']} entities",
+            f"Added: {entity_changes['added']} new entities",
+            f"Modified: {entity_changes['modified']} entities",
+        ]
         
         if comparison.entities_added:
-            print("\nNew Entities:")
+            lines.append("\nNew Entities:")
             for entity in comparison.entities_added[:5]:
-                print(f"  • {entity['name']} ({entity['type']})")
+                lines.append(f"  • {entity['name']} ({entity['type']})")
         
-        print("\n🔗 EDGE CHANGES")
-        print("-" * 40)
-        changes = summary['changes']['edges']
-        print(f"Master: {changes['master_count']} edges")
-        print(f"Copy: {changes['copy_count']} edges")
-        print(f"Added: {changes['added']} new edges")
-        print(f"Modified: {changes['modified']} edges")
+        lines += [
+            "\n🔗 EDGE CHANGES",
+            "-" * 40,
+            f"Master: {edge_changes['master_count']} edges",
+            f"Copy: {edge_changes['copy_count']} edges",
+            f"Added: {edge_changes['added']} new edges",
+            f"Modified: {edge_changes['modified']} edges",
+        ]
         
         if comparison.edges_added:
-            print("\nNew Relationships:")
+            lines.append("\nNew Relationships:")
             for edge in comparison.edges_added[:5]:
                 fact = edge['fact'][:70] + "..." if len(edge['fact']) > 70 else edge['fact']
-                print(f"  • {edge['type']}: {fact}")
+                lines.append(f"  • {edge['type']}: {fact}")
+        
+        logger.info("\n".join(lines))
 
 def demo_clone_assessment():
     """Demonstrate clone-based impact assessment"""
-    print("=" * 60)
-    print("CLONE-BASED IMPACT ASSESSMENT DEMO")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("CLONE-BASED IMPACT ASSESSMENT DEMO")
+    logger.info("=" * 60)
     
     assessor = ZepCloneImpactAssessor()
     
     # Create a master graph with initial data
-    print("\n📊 Creating master graph with initial data...")
-    master_id = f"master_{uuid.uuid4().hex[:8]}"
+    logger.info("\n📊 Creating master graph with initial data...")
+    master_id = f"master_{secrets.token_hex(4)}"
     master = assessor.client.graph.create(
         graph_id=master_id,
         name="Master Graph",
         description="Master graph for clone assessment demo"
     )
-    print(f"✅ Created master graph: {master_id}")
+    logger.info(f"✅ Created master graph: {master_id}")
     
     # Add some initial data to master
     initial_data = """
@@ -433,16 +506,22 @@ def demo_clone_assessment():
     John Smith is the CEO of Acme Corporation.
     """
     
-    print("📝 Adding initial data to master...")
+    logger.info("📝 Adding initial data to master...")
     episode = assessor.client.graph.add(
         graph_id=master_id,
         type="text",
         data=initial_data
     )
     
-    # Wait for processing
-    print("⏳ Waiting for initial data processing...")
-    time.sleep(10)
+    # The clone must include the initial data, so wait for it rather than
+    # sleeping a fixed interval
+    logger.info("⏳ Waiting for initial data processing...")
+    episode_uuid = episode.uuid_ if hasattr(episode, 'uuid_') else None
+    if episode_uuid:
+        assessor.wait_for_episode(episode_uuid)
+    else:
+        flush_log()
+        time.sleep(10)
     
     # Now perform impact assessment with new data
     new_data = """
@@ -453,9 +532,9 @@ def demo_clone_assessment():
     John Smith announced the acquisition at TechConf 2025.
     """
     
-    print("\n" + "=" * 40)
-    print("ASSESSING IMPACT OF NEW DATA")
-    print("=" * 40)
+    logger.info("\n" + "=" * 40)
+    logger.info("ASSESSING IMPACT OF NEW DATA")
+    logger.info("=" * 40)
     
     # Perform clone-based assessment
     comparison = assessor.assess_impact_with_clone(
@@ -469,23 +548,23 @@ def demo_clone_assessment():
         assessor.print_comparison_report(comparison)
         
         # Decision point
-        print("\n" + "=" * 40)
-        print("DECISION POINT")
-        print("=" * 40)
-        print("\nBased on the changes above:")
-        print("1. APPROVE - Make copy the new master")
-        print("2. REJECT - Discard copy and keep master")
+        logger.info("\n" + "=" * 40)
+        logger.info("DECISION POINT")
+        logger.info("=" * 40)
+        logger.info("\nBased on the changes above:")
+        logger.info("1. APPROVE - Make copy the new master")
+        logger.info("2. REJECT - Discard copy and keep master")
         
         # Auto-approve for demo
-        print("\n🤖 Auto-approving for demonstration...")
+        logger.info("\n🤖 Auto-approving for demonstration...")
         assessor.approve_changes(comparison)
         
-        print(f"\n✅ Assessment complete")
-        print(f"  Active graph: {comparison.copy_id}")
-        print(f"  Archived graph: {comparison.master_id}")
+        logger.info("\n✅ Assessment complete")
+        logger.info(f"  Active graph: {assessor.current_master(master_id)}")
+        logger.info(f"  Archived graph: {comparison.master_id}")
     
     return master_id
 
 if __name__ == "__main__":
     master_id = demo_clone_assessment()
-    print(f"\n✅ Clone-based assessment demo complete")
\ No newline at end of file
+    logger.info("\n✅ Clone-based assessment demo complete")
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Zep Prototype Helpers
+Shared by the krypton-prototype scripts:
+1. Buffered stdout logging
+2. A shared, pooled Zep client per API key
+3. Paging through the uuid-cursor node/edge list endpoints
+"""
+
+import logging
+import logging.handlers
+import os
+import sys
+from functools import lru_cache
+from typing import Any, List
+import httpx
+from zep_cloud.client import Zep
+
+# Page size for the uuid-cursor node/edge list endpoints
+LIST_PAGE_SIZE = 100
+
+# Log to stdout through a buffer so output is written in blocks rather than
+# one write per line; LOG_LEVEL (default INFO) filters what is emitted and
+# flush_log() is called before long waits
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=200, flushLevel=logging.WARNING, target=_stdout_handler
+)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a logger that writes through the shared stdout buffer"""
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s", handlers=[_log_buffer]
+    )
+    return logging.getLogger(name)
+
+
+def flush_log():
+    """Write any buffered log output"""
+    _log_buffer.flush()
+
+
+@lru_cache(maxsize=None)
+def get_zep(api_key: str) -> Zep:
+    """Return one Zep client per API key so its keep-alive connection pool
+    is shared by every caller and concurrent query in the process"""
+    return Zep(
+        api_key=api_key,
+        httpx_client=httpx.Client(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            # Retries failed connection attempts; HTTP error responses are
+            # left to the SDK's own retry handling
+            transport=httpx.HTTPTransport(retries=3),
+            # The SDK takes its request timeout from this client; keep its
+            # 60s default rather than httpx's 5s
+            timeout=60
+        )
+    )
+
+
+def list_all(list_page, owner_id: str, page_size: int = LIST_PAGE_SIZE) -> List[Any]:
+    """Fetch every item from a uuid-cursor paginated graph list endpoint"""
+    items = []
+    cursor = None
+    while True:
+        page = list_page(owner_id, limit=page_size, uuid_cursor=cursor) or []
+        items.extend(page)
+        if len(page) < page_size:
+            return items
+        cursor = page[-1].uuid_
@@ -12,7 +12,7 @@ from dotenv import load_dotenv
 from zep_cloud.client import Zep
 from zep_cloud.types import Message
 from zep_cloud.external_clients.ontology import EntityModel, EdgeModel, EntityText, EntityBoolean, EntityFloat, EntityInt
-from zep_cloud import EntityEdgeSourceTarget
+from zep_cloud import EntityEdgeSourceTarget, EpisodeData
 from pydantic import Field
 
 # Load environment variables
@@ -35,6 +35,19 @@ class EmployedBy(EdgeModel):
     position: EntityText = Field(description="Job title", default=None)
     department: EntityText = Field(description="Department", default=None)
 
+# Ontology applied to every test graph
+ENTITIES = {
+    "TechnologyCompany": TechnologyCompany,
+    "Developer": Developer
+}
+
+EDGES = {
+    "EMPLOYED_BY": (
+        EmployedBy,
+        [EntityEdgeSourceTarget(source="Developer", target="TechnologyCompany")]
+    )
+}
+
 def test_zep_functionality():
     """Test all Zep functionality"""
     print("=" * 60)
@@ -62,22 +75,10 @@ def test_zep_functionality():
     print(f"✅ Created graph: {graph_id}")
     
     # Set custom types for the graph
-    entities = {
-        "TechnologyCompany": TechnologyCompany,
-        "Developer": Developer
-    }
-    
-    edges = {
-        "EMPLOYED_BY": (
-            EmployedBy,
-            [EntityEdgeSourceTarget(source="Developer", target="TechnologyCompany")]
-        )
-    }
-    
     client.graph.set_ontology(
         graph_ids=[graph_id],
-        entities=entities,
-        edges=edges
+        entities=ENTITIES,
+        edges=EDGES
     )
     print("✅ Set custom ontology for graph")
     
@@ -93,12 +94,6 @@ def test_zep_functionality():
         ]
     }
     
-    client.graph.add(
-        graph_id=graph_id,
-        type="json",
-        data=json.dumps(tech_data)
-    )
-    
     # Add relationship data
     relationships = """
     John Smith is employed by InnovateTech as Senior Developer in the AI department.
@@ -106,10 +101,13 @@ def test_zep_functionality():
     InnovateTech is a technology company specializing in AI, founded in 2021.
     """
     
-    client.graph.add(
+    # Both episodes go up in one batch request
+    client.graph.add_batch(
         graph_id=graph_id,
-        type="text",
-        data=relationships
+        episodes=[
+            EpisodeData(data=json.dumps(tech_data), type="json"),
+            EpisodeData(data=relationships, type="text")
+        ]
     )
     print("✅ Added data to graph")
     
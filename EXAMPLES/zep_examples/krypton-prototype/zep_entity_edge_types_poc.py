@@ -7,20 +7,29 @@ This script demonstrates:
 4. Testing the differences between graph_id and user_id type handling
 """
 
+import argparse
 import os
-import uuid
+import secrets
 import json
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
-from zep_cloud.client import Zep
 from zep_cloud.types import Message
 from zep_cloud.external_clients.ontology import EntityModel, EdgeModel, EntityText, EntityBoolean, EntityFloat, EntityInt
-from zep_cloud import EntityEdgeSourceTarget
+from zep_cloud import EntityEdgeSourceTarget, EpisodeData
 from pydantic import Field
+from zep_common import get_logger, get_zep
 
 # Load environment variables
 load_dotenv()
 
+# Resource ids from the last run, reused unless --fresh is given
+STATE_PATH = Path(__file__).with_name(".zep_poc_state.json")
+
+logger = get_logger(__name__)
+
 # ============================================
 # CUSTOM ENTITY AND EDGE TYPE DEFINITIONS
 # ============================================
@@ -123,6 +132,185 @@ class Develops(EdgeModel):
         default=None
     )
 
+# ============================================
+# ONTOLOGIES
+# ============================================
+
+ENTITIES = {
+    "TechnologyCompany": TechnologyCompany,
+    "Developer": Developer,
+    "Project": Project
+}
+
+def _build_edges(include_user: bool = False):
+    """Build the edge types; user graphs also accept the default User entity
+    as the source of WORKS_ON and EMPLOYED_BY"""
+    sources = ("User", "Developer") if include_user else ("Developer",)
+    
+    def developer_sources(target):
+        return tuple(EntityEdgeSourceTarget(source=source, target=target) for source in sources)
+    
+    return {
+        "WORKS_ON": (WorksOn, developer_sources("Project")),
+        "EMPLOYED_BY": (EmployedBy, developer_sources("TechnologyCompany")),
+        "DEVELOPS": (
+            Develops,
+            (EntityEdgeSourceTarget(source="TechnologyCompany", target="Project"),)
+        )
+    }
+
+# Edge types for general graphs and for user graphs
+GRAPH_EDGES = _build_edges()
+USER_EDGES = _build_edges(include_user=True)
+
+# ============================================
+# DEFAULT TYPES
+# ============================================
+
+# Entity types Zep applies to user graphs out of the box
+DEFAULT_ENTITY_TYPES = (
+    "User - A human that is part of the current chat thread",
+    "Assistant - The AI assistant in the conversation",
+    "Preference - A user's expressed like, dislike, or preference",
+    "Location - A physical or virtual place",
+    "Event - A time-bound activity or occurrence",
+    "Object - A physical item, tool, device, or possession",
+    "Topic - A subject of conversation or interest",
+    "Organization - A company, institution, or group",
+    "Document - Information content in various forms"
+)
+
+DEFAULT_EDGE_TYPES = (
+    "LocatedAt - Entity exists at a specific location",
+    "OccurredAt - Event happened at a specific time/location",
+    "ParticipatedIn - User took part in an event",
+    "Owns - Ownership or possession of an object",
+    "Uses - Usage or interaction with an object",
+    "WorksFor - Employment relationship with organization",
+    "Discusses - User talks about or is interested in a topic",
+    "RelatesTo - General conceptual relationship"
+)
+
+# ============================================
+# SAMPLE DATA
+# ============================================
+
+# JSON data that should trigger the custom types on a general graph
+TECH_DATA = {
+    "companies": [
+        {
+            "name": "TechVentures Inc",
+            "type": "Technology Company",
+            "industry": "AI and Machine Learning",
+            "founded": 2020,
+            "public": False,
+            "developers": [
+                {
+                    "name": "Alex Chen",
+                    "role": "Senior Developer",
+                    "language": "Python",
+                    "experience": 8,
+                    "specialization": "Machine Learning"
+                },
+                {
+                    "name": "Maria Garcia",
+                    "role": "Lead Developer", 
+                    "language": "JavaScript",
+                    "experience": 10,
+                    "specialization": "Full-stack"
+                }
+            ],
+            "projects": [
+                {
+                    "name": "AI Assistant Platform",
+                    "type": "Web Application",
+                    "stack": "Python, React, PostgreSQL",
+                    "status": "Production"
+                },
+                {
+                    "name": "Data Pipeline Framework",
+                    "type": "Library",
+                    "stack": "Python, Apache Spark",
+                    "status": "Development"
+                }
+            ]
+        }
+    ],
+    "relationships": [
+        "Alex Chen works on AI Assistant Platform as Lead Developer since January 2023",
+        "Maria Garcia works on Data Pipeline Framework as Architect",
+        "TechVentures Inc develops both projects with high priority",
+        "Alex Chen is employed by TechVentures Inc as Senior ML Engineer in the R&D department",
+        "Maria Garcia is employed by TechVentures Inc as Lead Full-stack Developer"
+    ]
+}
+
+# Both episode payloads are fixed, so serialize them once at import
+TECH_DATA_JSON = json.dumps(TECH_DATA)
+TECH_RELATIONSHIPS_TEXT = "\n".join(TECH_DATA["relationships"])
+
+# Messages sent per thread.add_messages call
+MESSAGE_BATCH_SIZE = 30
+
+# (name, content, role) turns of a conversation that should trigger the
+# custom types on a user graph
+SAMPLE_CONVERSATION = (
+    ("Sam Developer",
+     "I'm a Python developer with 5 years of experience, specializing in backend development.",
+     "user"),
+    ("Assistant",
+     "Great! What projects are you currently working on?",
+     "assistant"),
+    ("Sam Developer",
+     "I work at CloudTech Solutions, a SaaS company founded in 2019. I'm the lead developer on our API Gateway project, which is a microservices framework built with Python and FastAPI. It's currently in production.",
+     "user"),
+    ("Assistant",
+     "That sounds interesting! How long have you been working on the API Gateway?",
+     "assistant"),
+    ("Sam Developer",
+     "I've been working on it since March 2023 as the primary contributor. CloudTech develops this as a high-priority project with over $500K invested in it.",
+     "user")
+)
+
+def _conversation_messages():
+    """Yield the sample conversation as Message objects"""
+    for name, content, role in SAMPLE_CONVERSATION:
+        yield Message(name=name, content=content, role=role)
+
+# ============================================
+# SEARCH FILTERS AND RESULT FORMATTING
+# ============================================
+
+SEPARATOR = "=" * 60
+ITEM_SEPARATOR = "\n  ---"
+
+def _banner(title: str, leading_newline: bool = True) -> str:
+    """Return a section title framed by separator lines"""
+    banner = f"{SEPARATOR}\n{title}\n{SEPARATOR}"
+    return "\n" + banner if leading_newline else banner
+
+# Search filters used to verify the types, built once
+DEVELOPER_FILTER = {"node_labels": ["Developer"]}
+EMPLOYED_BY_FILTER = {"edge_types": ["EMPLOYED_BY"]}
+PROJECT_FILTER = {"node_labels": ["Project"]}
+PREFERENCE_FILTER = {"node_labels": ["Preference"]}
+
+def _format_node(node, fields=()):
+    """Render a node's name, labels and the given (label, attribute) pairs"""
+    lines = [f"  Name: {node.name}", f"  Labels: {getattr(node, 'labels', 'N/A')}"]
+    attrs = getattr(node, 'attributes', None)
+    if attrs:
+        lines.extend(f"  {label}: {attrs.get(key, 'N/A')}" for label, key in fields)
+    return "\n".join(lines)
+
+def _format_edge(edge, fields=()):
+    """Render an edge's fact, type and the given (label, attribute) pairs"""
+    lines = [f"  Fact: {getattr(edge, 'fact', 'N/A')}", f"  Type: {getattr(edge, 'name', 'N/A')}"]
+    attrs = getattr(edge, 'attributes', None)
+    if attrs:
+        lines.extend(f"  {label}: {attrs.get(key, 'N/A')}" for label, key in fields)
+    return "\n".join(lines)
+
 # ============================================
 # ZEP POC CLASS WITH ENTITY/EDGE TYPES
 # ============================================
@@ -134,241 +322,118 @@ class ZepEntityTypePOC:
         if not api_key or api_key == 'your_zep_api_key_here':
             raise ValueError("Please set your ZEP_API_KEY in the .env file")
         
-        self.client = Zep(api_key=api_key)
-        print("✅ Successfully connected to Zep")
+        self.client = get_zep(api_key)
+        logger.info("✅ Successfully connected to Zep")
     
     def explore_default_types(self):
         """Research and document default Entity and Edge Types"""
-        print("\n" + "=" * 60)
-        print("DEFAULT ENTITY AND EDGE TYPES IN ZEP")
-        print("=" * 60)
+        logger.info(_banner("DEFAULT ENTITY AND EDGE TYPES IN ZEP"))
         
-        print("\n📚 Default Entity Types (applied to user graphs):")
-        default_entities = [
-            "User - A human that is part of the current chat thread",
-            "Assistant - The AI assistant in the conversation", 
-            "Preference - A user's expressed like, dislike, or preference",
-            "Location - A physical or virtual place",
-            "Event - A time-bound activity or occurrence",
-            "Object - A physical item, tool, device, or possession",
-            "Topic - A subject of conversation or interest",
-            "Organization - A company, institution, or group",
-            "Document - Information content in various forms"
-        ]
-        for entity in default_entities:
-            print(f"  • {entity}")
+        logger.info("\n📚 Default Entity Types (applied to user graphs):\n"
+                    + "\n".join(f"  • {entity}" for entity in DEFAULT_ENTITY_TYPES))
         
-        print("\n🔗 Default Edge Types (relationships):")
-        default_edges = [
-            "LocatedAt - Entity exists at a specific location",
-            "OccurredAt - Event happened at a specific time/location",
-            "ParticipatedIn - User took part in an event",
-            "Owns - Ownership or possession of an object",
-            "Uses - Usage or interaction with an object",
-            "WorksFor - Employment relationship with organization",
-            "Discusses - User talks about or is interested in a topic",
-            "RelatesTo - General conceptual relationship"
-        ]
-        for edge in default_edges:
-            print(f"  • {edge}")
+        logger.info("\n🔗 Default Edge Types (relationships):\n"
+                    + "\n".join(f"  • {edge}" for edge in DEFAULT_EDGE_TYPES))
         
-        print("\n💡 Key Insight:")
-        print("  User graphs automatically use these default types to classify")
-        print("  entities and relationships extracted from conversations.")
-        print("  General graphs don't use types by default unless custom types are set.")
+        logger.info("\n💡 Key Insight:\n"
+                    "  User graphs automatically use these default types to classify\n"
+                    "  entities and relationships extracted from conversations.\n"
+                    "  General graphs don't use types by default unless custom types are set.")
     
     def set_custom_types_for_graph(self, graph_id=None):
         """Set custom entity and edge types for a specific graph"""
         try:
-            print("\n🎯 Setting custom types for graph...")
-            
-            # Define the ontology
-            entities = {
-                "TechnologyCompany": TechnologyCompany,
-                "Developer": Developer,
-                "Project": Project
-            }
-            
-            edges = {
-                "WORKS_ON": (
-                    WorksOn,
-                    [EntityEdgeSourceTarget(source="Developer", target="Project")]
-                ),
-                "EMPLOYED_BY": (
-                    EmployedBy,
-                    [EntityEdgeSourceTarget(source="Developer", target="TechnologyCompany")]
-                ),
-                "DEVELOPS": (
-                    Develops,
-                    [EntityEdgeSourceTarget(source="TechnologyCompany", target="Project")]
-                )
-            }
+            logger.info("\n🎯 Setting custom types for graph...")
             
             # Set ontology for specific graph if provided, otherwise project-wide
             if graph_id:
                 self.client.graph.set_ontology(
                     graph_ids=[graph_id],
-                    entities=entities,
-                    edges=edges
+                    entities=ENTITIES,
+                    edges=GRAPH_EDGES
                 )
-                print(f"✅ Custom types set for graph: {graph_id}")
+                logger.info("✅ Custom types set for graph: %s", graph_id)
             else:
                 self.client.graph.set_ontology(
-                    entities=entities,
-                    edges=edges
+                    entities=ENTITIES,
+                    edges=GRAPH_EDGES
                 )
-                print("✅ Custom types set project-wide")
+                logger.info("✅ Custom types set project-wide")
                 
             return True
         except Exception as e:
-            print(f"❌ Error setting custom types: {e}")
+            logger.warning("❌ Error setting custom types: %s", e)
             return False
     
     def set_custom_types_for_user(self, user_id):
         """Set custom entity and edge types for a specific user"""
         try:
-            print("\n🎯 Setting custom types for user graph...")
-            
-            # Define the ontology (can be same or different from graph ontology)
-            entities = {
-                "TechnologyCompany": TechnologyCompany,
-                "Developer": Developer,
-                "Project": Project
-            }
-            
-            edges = {
-                "WORKS_ON": (
-                    WorksOn,
-                    [EntityEdgeSourceTarget(source="User", target="Project"),
-                     EntityEdgeSourceTarget(source="Developer", target="Project")]
-                ),
-                "EMPLOYED_BY": (
-                    EmployedBy,
-                    [EntityEdgeSourceTarget(source="User", target="TechnologyCompany"),
-                     EntityEdgeSourceTarget(source="Developer", target="TechnologyCompany")]
-                ),
-                "DEVELOPS": (
-                    Develops,
-                    [EntityEdgeSourceTarget(source="TechnologyCompany", target="Project")]
-                )
-            }
+            logger.info("\n🎯 Setting custom types for user graph...")
             
             self.client.graph.set_ontology(
                 user_ids=[user_id],
-                entities=entities,
-                edges=edges
+                entities=ENTITIES,
+                edges=USER_EDGES
             )
-            print(f"✅ Custom types set for user: {user_id}")
+            logger.info("✅ Custom types set for user: %s", user_id)
             return True
         except Exception as e:
-            print(f"❌ Error setting custom types for user: {e}")
+            logger.warning("❌ Error setting custom types for user: %s", e)
             return False
     
     def create_and_populate_graph_with_types(self):
-        """Create a graph and add typed data"""
-        print("\n" + "=" * 60)
-        print("TESTING CUSTOM TYPES WITH GENERAL GRAPH")
-        print("=" * 60)
+        """Create a graph and add typed data
+        
+        Returns the graph id, or None if any step failed.
+        """
+        logger.info(_banner("TESTING CUSTOM TYPES WITH GENERAL GRAPH"))
         
         # Create graph
-        graph_id = f"tech_graph_{uuid.uuid4().hex[:8]}"
+        graph_id = f"tech_graph_{secrets.token_hex(4)}"
         try:
             graph = self.client.graph.create(
                 graph_id=graph_id,
                 name="Technology Companies Graph",
                 description="Graph with custom entity and edge types for tech domain"
             )
-            print(f"✅ Created graph: {graph_id}")
+            logger.info("✅ Created graph: %s", graph_id)
         except Exception as e:
-            print(f"❌ Error creating graph: {e}")
+            logger.warning("❌ Error creating graph: %s", e)
             return None
         
         # Set custom types for this graph
         if not self.set_custom_types_for_graph(graph_id):
             return None
         
-        # Add JSON data that should trigger custom types
-        tech_data = {
-            "companies": [
-                {
-                    "name": "TechVentures Inc",
-                    "type": "Technology Company",
-                    "industry": "AI and Machine Learning",
-                    "founded": 2020,
-                    "public": False,
-                    "developers": [
-                        {
-                            "name": "Alex Chen",
-                            "role": "Senior Developer",
-                            "language": "Python",
-                            "experience": 8,
-                            "specialization": "Machine Learning"
-                        },
-                        {
-                            "name": "Maria Garcia",
-                            "role": "Lead Developer", 
-                            "language": "JavaScript",
-                            "experience": 10,
-                            "specialization": "Full-stack"
-                        }
-                    ],
-                    "projects": [
-                        {
-                            "name": "AI Assistant Platform",
-                            "type": "Web Application",
-                            "stack": "Python, React, PostgreSQL",
-                            "status": "Production"
-                        },
-                        {
-                            "name": "Data Pipeline Framework",
-                            "type": "Library",
-                            "stack": "Python, Apache Spark",
-                            "status": "Development"
-                        }
-                    ]
-                }
-            ],
-            "relationships": [
-                "Alex Chen works on AI Assistant Platform as Lead Developer since January 2023",
-                "Maria Garcia works on Data Pipeline Framework as Architect",
-                "TechVentures Inc develops both projects with high priority",
-                "Alex Chen is employed by TechVentures Inc as Senior ML Engineer in the R&D department",
-                "Maria Garcia is employed by TechVentures Inc as Lead Full-stack Developer"
-            ]
-        }
-        
         try:
-            # Add as JSON
-            self.client.graph.add(
+            # Add as JSON, and also as text to ensure relationships are
+            # captured; both episodes go up in one batch request
+            self.client.graph.add_batch(
                 graph_id=graph_id,
-                type="json",
-                data=json.dumps(tech_data)
+                episodes=[
+                    EpisodeData(data=TECH_DATA_JSON, type="json"),
+                    EpisodeData(data=TECH_RELATIONSHIPS_TEXT, type="text")
+                ]
             )
-            print("✅ Added JSON data with tech entities")
-            
-            # Also add as text to ensure relationships are captured
-            text_data = "\n".join(tech_data["relationships"])
-            self.client.graph.add(
-                graph_id=graph_id,
-                type="text",
-                data=text_data
-            )
-            print("✅ Added relationship text data")
+            logger.info("✅ Added JSON data with tech entities")
+            logger.info("✅ Added relationship text data")
             
         except Exception as e:
-            print(f"❌ Error adding data: {e}")
+            logger.warning("❌ Error adding data: %s", e)
+            return None
         
         return graph_id
     
     def create_and_populate_user_with_types(self):
-        """Create a user and add typed conversation data"""
-        print("\n" + "=" * 60)
-        print("TESTING CUSTOM TYPES WITH USER GRAPH")
-        print("=" * 60)
+        """Create a user and add typed conversation data
+        
+        Returns (user_id, thread_id), or (None, None) if any step failed.
+        """
+        logger.info(_banner("TESTING CUSTOM TYPES WITH USER GRAPH"))
         
         # Create user
-        user_id = f"dev_user_{uuid.uuid4().hex[:8]}"
-        thread_id = f"thread_{uuid.uuid4().hex[:8]}"
+        user_id = f"dev_user_{secrets.token_hex(4)}"
+        thread_id = f"thread_{secrets.token_hex(4)}"
         
         try:
             user = self.client.user.add(
@@ -377,173 +442,174 @@ class ZepEntityTypePOC:
                 first_name="Sam",
                 last_name="Developer"
             )
-            print(f"✅ Created user: {user_id}")
+            logger.info("✅ Created user: %s", user_id)
             
             self.client.thread.create(
                 thread_id=thread_id,
                 user_id=user_id
             )
-            print(f"✅ Created thread: {thread_id}")
+            logger.info("✅ Created thread: %s", thread_id)
         except Exception as e:
-            print(f"❌ Error creating user: {e}")
+            logger.warning("❌ Error creating user: %s", e)
             return None, None
         
         # Set custom types for this user
         if not self.set_custom_types_for_user(user_id):
-            return user_id, thread_id
-        
-        # Add conversation that should trigger custom types
-        messages = [
-            Message(
-                name="Sam Developer",
-                content="I'm a Python developer with 5 years of experience, specializing in backend development.",
-                role="user"
-            ),
-            Message(
-                name="Assistant",
-                content="Great! What projects are you currently working on?",
-                role="assistant"
-            ),
-            Message(
-                name="Sam Developer",
-                content="I work at CloudTech Solutions, a SaaS company founded in 2019. I'm the lead developer on our API Gateway project, which is a microservices framework built with Python and FastAPI. It's currently in production.",
-                role="user"
-            ),
-            Message(
-                name="Assistant",
-                content="That sounds interesting! How long have you been working on the API Gateway?",
-                role="assistant"
-            ),
-            Message(
-                name="Sam Developer",
-                content="I've been working on it since March 2023 as the primary contributor. CloudTech develops this as a high-priority project with over $500K invested in it.",
-                role="user"
-            )
-        ]
+            return None, None
         
+        # Add conversation that should trigger custom types, building the
+        # messages lazily and sending them in bounded batches
+        messages = _conversation_messages()
         try:
-            self.client.thread.add_messages(thread_id, messages=messages)
-            print("✅ Added conversation with tech-specific content")
+            while True:
+                batch = list(islice(messages, MESSAGE_BATCH_SIZE))
+                if not batch:
+                    break
+                self.client.thread.add_messages(thread_id, messages=batch)
+            logger.info("✅ Added conversation with tech-specific content")
         except Exception as e:
-            print(f"❌ Error adding messages: {e}")
+            logger.warning("❌ Error adding messages: %s", e)
+            return None, None
         
         return user_id, thread_id
     
     def search_and_verify_types(self, graph_id=None, user_id=None):
         """Search graphs and verify entity/edge types are applied"""
-        print("\n" + "=" * 60)
-        print("VERIFYING ENTITY AND EDGE TYPES")
-        print("=" * 60)
+        logger.info(_banner("VERIFYING ENTITY AND EDGE TYPES"))
         
-        if graph_id:
-            print(f"\n🔍 Searching graph {graph_id} for typed entities...")
-            
-            # Search for Developer entities
-            try:
-                results = self.client.graph.search(
+        # The searches are independent, so run them side by side and render
+        # the results in order afterwards
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            if graph_id:
+                developers_future = executor.submit(
+                    self.client.graph.search,
                     graph_id=graph_id,
                     query="developers working on projects",
                     scope="nodes",
-                    search_filters={"node_labels": ["Developer"]},
+                    search_filters=DEVELOPER_FILTER,
+                    limit=5
+                )
+                employment_future = executor.submit(
+                    self.client.graph.search,
+                    graph_id=graph_id,
+                    query="employment relationships",
+                    scope="edges",
+                    search_filters=EMPLOYED_BY_FILTER,
+                    limit=5
+                )
+            if user_id:
+                projects_future = executor.submit(
+                    self.client.graph.search,
+                    user_id=user_id,
+                    query="projects being developed",
+                    scope="nodes",
+                    search_filters=PROJECT_FILTER,
+                    limit=5
+                )
+                preferences_future = executor.submit(
+                    self.client.graph.search,
+                    user_id=user_id,
+                    query="user preferences",
+                    scope="nodes",
+                    search_filters=PREFERENCE_FILTER,
                     limit=5
                 )
+        
+        if graph_id:
+            logger.info("\n🔍 Searching graph %s for typed entities...", graph_id)
+            
+            # Search for Developer entities
+            try:
+                results = developers_future.result()
                 
-                print("\n📊 Developer Entities Found:")
+                logger.info("\n📊 Developer Entities Found:")
                 if results.nodes:
-                    for node in results.nodes:
-                        print(f"  Name: {node.name}")
-                        print(f"  Labels: {node.labels if hasattr(node, 'labels') else 'N/A'}")
-                        if hasattr(node, 'attributes') and node.attributes:
-                            attrs = node.attributes
-                            print(f"  Primary Language: {attrs.get('primary_language', 'N/A')}")
-                            print(f"  Specialization: {attrs.get('specialization', 'N/A')}")
-                            print(f"  Years Experience: {attrs.get('years_experience', 'N/A')}")
-                        print("  ---")
+                    logger.info("\n".join(
+                        _format_node(node, (
+                            ("Primary Language", "primary_language"),
+                            ("Specialization", "specialization"),
+                            ("Years Experience", "years_experience")
+                        )) + ITEM_SEPARATOR
+                        for node in results.nodes
+                    ))
                 else:
-                    print("  No Developer entities found")
+                    logger.info("  No Developer entities found")
                     
             except Exception as e:
-                print(f"  Error searching for developers: {e}")
+                logger.warning("  Error searching for developers: %s", e)
             
             # Search for EMPLOYED_BY edges
             try:
-                results = self.client.graph.search(
-                    graph_id=graph_id,
-                    query="employment relationships",
-                    scope="edges",
-                    search_filters={"edge_types": ["EMPLOYED_BY"]},
-                    limit=5
-                )
+                results = employment_future.result()
                 
-                print("\n🔗 EMPLOYED_BY Relationships Found:")
+                logger.info("\n🔗 EMPLOYED_BY Relationships Found:")
                 if results.edges:
-                    for edge in results.edges:
-                        print(f"  Fact: {edge.fact if hasattr(edge, 'fact') else 'N/A'}")
-                        print(f"  Type: {edge.name if hasattr(edge, 'name') else 'N/A'}")
-                        if hasattr(edge, 'attributes') and edge.attributes:
-                            attrs = edge.attributes
-                            print(f"  Position: {attrs.get('position', 'N/A')}")
-                            print(f"  Department: {attrs.get('department', 'N/A')}")
-                        print("  ---")
+                    logger.info("\n".join(
+                        _format_edge(edge, (
+                            ("Position", "position"),
+                            ("Department", "department")
+                        )) + ITEM_SEPARATOR
+                        for edge in results.edges
+                    ))
                 else:
-                    print("  No EMPLOYED_BY relationships found")
+                    logger.info("  No EMPLOYED_BY relationships found")
                     
             except Exception as e:
-                print(f"  Error searching for employment edges: {e}")
+                logger.warning("  Error searching for employment edges: %s", e)
         
         if user_id:
-            print(f"\n🔍 Searching user {user_id} for typed entities...")
+            logger.info("\n🔍 Searching user %s for typed entities...", user_id)
             
             # Search user graph for custom types
             try:
                 # Search for Project entities
-                results = self.client.graph.search(
-                    user_id=user_id,
-                    query="projects being developed",
-                    scope="nodes",
-                    search_filters={"node_labels": ["Project"]},
-                    limit=5
-                )
+                results = projects_future.result()
                 
-                print("\n📊 Project Entities in User Graph:")
+                logger.info("\n📊 Project Entities in User Graph:")
                 if results.nodes:
-                    for node in results.nodes:
-                        print(f"  Name: {node.name}")
-                        print(f"  Labels: {node.labels if hasattr(node, 'labels') else 'N/A'}")
-                        if hasattr(node, 'attributes') and node.attributes:
-                            attrs = node.attributes
-                            print(f"  Project Type: {attrs.get('project_type', 'N/A')}")
-                            print(f"  Tech Stack: {attrs.get('tech_stack', 'N/A')}")
-                            print(f"  Status: {attrs.get('status', 'N/A')}")
-                        print("  ---")
+                    logger.info("\n".join(
+                        _format_node(node, (
+                            ("Project Type", "project_type"),
+                            ("Tech Stack", "tech_stack"),
+                            ("Status", "status")
+                        )) + ITEM_SEPARATOR
+                        for node in results.nodes
+                    ))
                 else:
-                    print("  No Project entities found")
+                    logger.info("  No Project entities found")
                     
                 # Also check for default Preference types (should still work)
-                results = self.client.graph.search(
-                    user_id=user_id,
-                    query="user preferences",
-                    scope="nodes",
-                    search_filters={"node_labels": ["Preference"]},
-                    limit=5
-                )
+                results = preferences_future.result()
                 
-                print("\n📊 Default Preference Entities (if any):")
+                logger.info("\n📊 Default Preference Entities (if any):")
                 if results.nodes:
-                    for node in results.nodes:
-                        print(f"  Name: {node.name}")
-                        print(f"  Labels: {node.labels if hasattr(node, 'labels') else 'N/A'}")
+                    logger.info("\n".join(_format_node(node) for node in results.nodes))
                 else:
-                    print("  No Preference entities found")
+                    logger.info("  No Preference entities found")
                     
             except Exception as e:
-                print(f"  Error searching user graph: {e}")
+                logger.warning("  Error searching user graph: %s", e)
+
+def _load_state():
+    """Return the resource ids saved by a previous run, or None"""
+    try:
+        state = json.loads(STATE_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+    if all(state.get(key) for key in ("graph_id", "user_id", "thread_id")):
+        return state
+    return None
+
+def _save_state(state):
+    """Save the resource ids so the next run can reuse them"""
+    try:
+        STATE_PATH.write_text(json.dumps(state, indent=2))
+    except OSError as e:
+        logger.warning("⚠️ Could not save POC state: %s", e)
 
-def main():
+def main(fresh: bool = False):
     """Main execution function"""
-    print("=" * 60)
-    print("ZEP ENTITY AND EDGE TYPES RESEARCH POC")
-    print("=" * 60)
+    logger.info(_banner("ZEP ENTITY AND EDGE TYPES RESEARCH POC", leading_newline=False))
     
     # Initialize POC
     poc = ZepEntityTypePOC()
@@ -551,25 +617,34 @@ def main():
     # Step 1: Explore default types
     poc.explore_default_types()
     
-    # Step 2: Create and test graph with custom types
-    graph_id = poc.create_and_populate_graph_with_types()
-    
-    # Step 3: Create and test user with custom types
-    user_id, thread_id = poc.create_and_populate_user_with_types()
+    state = None if fresh else _load_state()
+    if state:
+        # Reuse the graph and user populated by a previous run
+        graph_id, user_id, thread_id = state["graph_id"], state["user_id"], state["thread_id"]
+        logger.info("\n♻️ Reusing resources from %s (run with --fresh to recreate)", STATE_PATH.name)
+    else:
+        # Step 2: Create and test graph with custom types
+        graph_id = poc.create_and_populate_graph_with_types()
+        
+        # Step 3: Create and test user with custom types
+        user_id, thread_id = poc.create_and_populate_user_with_types()
+        
+        # The create functions return None unless every step succeeded, so
+        # only fully populated resources are saved for reuse
+        if graph_id and user_id and thread_id:
+            _save_state({"graph_id": graph_id, "user_id": user_id, "thread_id": thread_id})
     
     # Step 4: Verify types are applied
     poc.search_and_verify_types(graph_id=graph_id, user_id=user_id)
     
-    print("\n" + "=" * 60)
-    print("KEY FINDINGS")
-    print("=" * 60)
-    print("\n📝 Summary:")
-    print("1. Default Types: User graphs automatically use default entity/edge types")
-    print("2. Custom Types: Can be set project-wide or for specific graphs/users")
-    print("3. Graph vs User: General graphs need explicit type setting, user graphs")
-    print("   have defaults but can be overridden with custom types")
-    print("4. Type Application: Entities and edges are classified into exactly one type")
-    print("5. Flexibility: Types can be changed but don't affect existing nodes/edges")
+    logger.info(_banner("KEY FINDINGS"))
+    logger.info("\n📝 Summary:")
+    logger.info("1. Default Types: User graphs automatically use default entity/edge types")
+    logger.info("2. Custom Types: Can be set project-wide or for specific graphs/users")
+    logger.info("3. Graph vs User: General graphs need explicit type setting, user graphs")
+    logger.info("   have defaults but can be overridden with custom types")
+    logger.info("4. Type Application: Entities and edges are classified into exactly one type")
+    logger.info("5. Flexibility: Types can be changed but don't affect existing nodes/edges")
     
     return {
         "graph_id": graph_id,
@@ -578,8 +653,11 @@ def main():
     }
 
 if __name__ == "__main__":
-    results = main()
-    print("\n📋 Created Resources:")
-    print(f"  Graph ID: {results.get('graph_id')}")
-    print(f"  User ID: {results.get('user_id')}")
-    print(f"  Thread ID: {results.get('thread_id')}")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fresh", action="store_true",
+                        help="create a new graph and user instead of reusing the saved ones")
+    results = main(fresh=parser.parse_args().fresh)
+    logger.info("\n📋 Created Resources:")
+    logger.info("  Graph ID: %s", results.get('graph_id'))
+    logger.info("  User ID: %s", results.get('user_id'))
+    logger.info("  Thread ID: %s", results.get('thread_id'))
\ No newline at end of file
@@ -7,19 +7,109 @@ c) Queries all episodes related to the uploaded data
 d) Presents all entities, edges and their types for each episode
 """
 
+import argparse
+import hashlib
 import os
 import uuid
 import json
+import re
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+import httpx
 from dotenv import load_dotenv
-from zep_cloud.client import Zep
+from zep_cloud import EpisodeData
+from zep_cloud.core.api_error import ApiError
 from zep_cloud.types import Message
 from typing import Dict, List, Any
+from zep_common import get_zep, list_all
 
 # Load environment variables
 load_dotenv()
 
+# Graph ids from previous runs, keyed by a digest of the data they hold
+STATE_PATH = Path(__file__).with_name(".zep_episode_state.json")
+
+# Text version of the company data for better relationship extraction
+COMPANY_TEXT = """
+NeuralTech Industries was founded in 2019 with headquarters in San Francisco.
+Sarah Chen serves as CEO since 2019, previously at Google AI Research.
+Michael Rodriguez is the CTO since 2020, formerly at Microsoft Azure ML.
+Emily Watson joined as VP of Engineering in 2021 from OpenAI.
+
+The company has three main products:
+- VisionAI Pro: Computer Vision Platform with 150 customers and $12M ARR
+- NLP Studio: Natural Language Processing Suite with 85 customers and $8M ARR
+- AutoML Enterprise: Automated Machine Learning with 45 customers and $5M ARR
+
+Engineering teams include Core ML (35 people, led by David Kim),
+Platform Engineering (28 people, led by Lisa Zhang),
+and Applied AI (42 people, led by James Thompson).
+"""
+
+# Matches each "Speaker: ..." turn up to the next speaker line or end of text
+SPEAKER_RE = re.compile(r'^(Robert|Manager):\s*(.*?)(?=^(?:Robert|Manager):|\Z)', re.M | re.S)
+
+# Transcript speaker label -> (message name, message role)
+SPEAKERS = {
+    "Robert": ("Robert Chen", "user"),
+    "Manager": ("Manager", "assistant")
+}
+
+# Most recent episodes fetched per graph or user
+EPISODE_LIMIT = 10
+
+# Messages sent per thread.add_messages call
+MESSAGE_BATCH_SIZE = int(os.getenv("ZEP_MESSAGE_BATCH_SIZE", "30"))
+
+def _data_digest(company_data: Dict) -> str:
+    """Digest of everything create_and_populate_graph uploads"""
+    payload = json.dumps(company_data, sort_keys=True) + COMPANY_TEXT
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+def _load_state() -> Dict[str, Any]:
+    """Return the state saved by a previous run, or an empty one"""
+    try:
+        return json.loads(STATE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _save_state(state: Dict[str, Any]):
+    """Save the state so the next run can reuse its graph"""
+    try:
+        STATE_PATH.write_text(json.dumps(state, indent=2))
+    except OSError as e:
+        print(f"⚠️ Could not save state: {e}")
+
+def _group_by(items: List[Dict], key: str, value: str) -> Dict[str, List]:
+    """Group item[value] by item[key], keeping first-seen order"""
+    groups = defaultdict(list)
+    for item in items:
+        groups[item[key]].append(item[value])
+    return groups
+
+def _entity_group_lines(entity_types: Dict[str, List[str]]) -> List[str]:
+    """Report lines listing entity names per type, the first 5 of each"""
+    lines = ["\nEntities Summary:"]
+    for etype, names in entity_types.items():
+        lines.append(f"\n{etype} ({len(names)} found):")
+        lines.extend(f"  • {name}" for name in names[:5])
+        if len(names) > 5:
+            lines.append(f"  ... and {len(names) - 5} more")
+    return lines
+
+def _edge_group_lines(edge_types: Dict[str, List[str]]) -> List[str]:
+    """Report lines listing edge facts per type, the first 3 of each"""
+    lines = ["\nRelationships Summary:"]
+    for etype, facts in edge_types.items():
+        lines.append(f"\n{etype} ({len(facts)} found):")
+        lines.extend(f"  • {fact:.100}..." for fact in facts[:3])
+        if len(facts) > 3:
+            lines.append(f"  ... and {len(facts) - 3} more")
+    return lines
+
 class ZepEpisodeAnalyzer:
     def __init__(self):
         """Initialize Zep client"""
@@ -27,13 +117,17 @@ class ZepEpisodeAnalyzer:
         if not api_key or api_key == 'your_zep_api_key_here':
             raise ValueError("Please set your ZEP_API_KEY in the .env file")
         
-        self.client = Zep(api_key=api_key)
+        self.client = get_zep(api_key)
         print("✅ Connected to Zep")
         
         # Store created IDs for tracking
         self.graph_id = None
         self.user_id = None
         self.thread_id = None
+        
+        # Episodes uploaded to each subject, checked by wait_for_processing
+        self.graph_episode_count = 0
+        self.user_message_count = 0
     
     def load_sample_data(self) -> Dict[str, Any]:
         """Load sample data files"""
@@ -55,8 +149,20 @@ class ZepEpisodeAnalyzer:
             "conversation_text": conversation_text
         }
     
-    def create_and_populate_graph(self, company_data: Dict) -> str:
-        """Create a graph and upload company data"""
+    def create_and_populate_graph(self, company_data: Dict, reuse: bool = True) -> str:
+        """Create a graph and upload company data
+        
+        With reuse, a graph populated from identical data by a previous run is
+        used as is instead of uploading the data again.
+        """
+        digest = _data_digest(company_data)
+        state = _load_state()
+        graphs = state.setdefault("graphs", {})
+        if reuse and digest in graphs:
+            self.graph_id = graphs[digest]
+            print(f"\n♻️ Reusing graph {self.graph_id} for unchanged company data (run with --fresh to recreate)")
+            return self.graph_id
+        
         print("\n📊 Creating and populating general graph...")
         
         # Create graph
@@ -68,37 +174,19 @@ class ZepEpisodeAnalyzer:
         )
         print(f"✅ Created graph: {self.graph_id}")
         
-        # Upload JSON data
-        self.client.graph.add(
+        # JSON and text episodes go up in one batch request
+        self.client.graph.add_batch(
             graph_id=self.graph_id,
-            type="json",
-            data=json.dumps(company_data)
+            episodes=[
+                EpisodeData(data=json.dumps(company_data), type="json"),
+                EpisodeData(data=COMPANY_TEXT, type="text")
+            ]
         )
-        print("✅ Uploaded company JSON data to graph")
-        
-        # Also add as text for better relationship extraction
-        company_text = f"""
-        NeuralTech Industries was founded in 2019 with headquarters in San Francisco.
-        Sarah Chen serves as CEO since 2019, previously at Google AI Research.
-        Michael Rodriguez is the CTO since 2020, formerly at Microsoft Azure ML.
-        Emily Watson joined as VP of Engineering in 2021 from OpenAI.
+        print("✅ Uploaded company JSON data and text summary to graph")
+        self.graph_episode_count = 2
         
-        The company has three main products:
-        - VisionAI Pro: Computer Vision Platform with 150 customers and $12M ARR
-        - NLP Studio: Natural Language Processing Suite with 85 customers and $8M ARR  
-        - AutoML Enterprise: Automated Machine Learning with 45 customers and $5M ARR
-        
-        Engineering teams include Core ML (35 people, led by David Kim),
-        Platform Engineering (28 people, led by Lisa Zhang),
-        and Applied AI (42 people, led by James Thompson).
-        """
-        
-        self.client.graph.add(
-            graph_id=self.graph_id,
-            type="text",
-            data=company_text
-        )
-        print("✅ Uploaded company text summary to graph")
+        graphs[digest] = self.graph_id
+        _save_state(state)
         
         return self.graph_id
     
@@ -124,59 +212,98 @@ class ZepEpisodeAnalyzer:
         )
         print(f"✅ Created thread: {self.thread_id}")
         
-        # Parse conversation into messages
+        # Parse conversation into messages in a single regex pass, dropping
+        # any turn that repeats an earlier one by the same speaker verbatim
+        turns = SPEAKER_RE.findall(conversation_text)
         messages = []
-        lines = conversation_text.split('\n')
-        current_speaker = None
-        current_content = []
-        
-        for line in lines:
-            if line.startswith('Robert:'):
-                if current_speaker and current_content:
-                    messages.append(Message(
-                        name=current_speaker,
-                        content=' '.join(current_content),
-                        role="user" if current_speaker == "Robert Chen" else "assistant"
-                    ))
-                current_speaker = "Robert Chen"
-                current_content = [line.replace('Robert:', '').strip()]
-            elif line.startswith('Manager:'):
-                if current_speaker and current_content:
-                    messages.append(Message(
-                        name=current_speaker,
-                        content=' '.join(current_content),
-                        role="user" if current_speaker == "Robert Chen" else "assistant"
-                    ))
-                current_speaker = "Manager"
-                current_content = [line.replace('Manager:', '').strip()]
-            elif line.strip() and current_content:
-                current_content.append(line.strip())
-        
-        # Add last message
-        if current_speaker and current_content:
-            messages.append(Message(
-                name=current_speaker,
-                content=' '.join(current_content),
-                role="user" if current_speaker == "Robert Chen" else "assistant"
-            ))
-        
-        # Upload messages
+        seen = set()
+        for speaker, body in turns:
+            content = " ".join(body.split())
+            if (speaker, content) in seen:
+                continue
+            seen.add((speaker, content))
+            messages.append(Message(name=SPEAKERS[speaker][0], content=content, role=SPEAKERS[speaker][1]))
+        
+        if len(messages) < len(turns):
+            print(f"ℹ️ Skipped {len(turns) - len(messages)} repeated conversation messages")
+        
+        # Upload messages in order, MESSAGE_BATCH_SIZE per request
         if messages:
-            self.client.thread.add_messages(self.thread_id, messages=messages)
+            for start in range(0, len(messages), MESSAGE_BATCH_SIZE):
+                self.client.thread.add_messages(
+                    self.thread_id,
+                    messages=messages[start:start + MESSAGE_BATCH_SIZE]
+                )
             print(f"✅ Uploaded {len(messages)} conversation messages to thread")
+            self.user_message_count = len(messages)
         
         return self.user_id, self.thread_id
     
-    def wait_for_processing(self, wait_time: int = 30):
-        """Wait for episodes to be processed"""
-        print(f"\n⏳ Waiting {wait_time} seconds for episode processing...")
-        for i in range(wait_time, 0, -5):
-            print(f"   {i} seconds remaining...")
-            time.sleep(5)
+    def wait_for_processing(self, max_wait: int = 60):
+        """Wait for the uploaded episodes to be processed
+        
+        Polls the most recent episodes of the graph and the user with
+        exponential backoff (1s doubling to 8s) and returns once every one of
+        them is processed, or after max_wait seconds.
+        """
+        print(f"\n⏳ Waiting up to {max_wait} seconds for episode processing...")
+        waiting = {}
+        if self.graph_episode_count:
+            waiting["Graph"] = lambda: self.client.graph.episode.get_by_graph_id(
+                self.graph_id, lastn=self.graph_episode_count
+            )
+        if self.user_message_count:
+            waiting["User"] = lambda: self.client.graph.episode.get_by_user_id(
+                self.user_id, lastn=self.user_message_count
+            )
+        
+        start = time.time()
+        delay = 1
+        while waiting:
+            for subject, get_recent in list(waiting.items()):
+                try:
+                    episodes = get_recent().episodes
+                except ApiError as e:
+                    # Episodes may not be listed yet; other errors are real
+                    if e.status_code != 404:
+                        raise
+                    continue
+                except httpx.TimeoutException:
+                    # A slow poll is not a failure; try again on the next tick
+                    continue
+                if episodes and all(ep.processed for ep in episodes):
+                    print(f"   {subject} episodes processed after {time.time() - start:.0f}s")
+                    del waiting[subject]
+            if not waiting:
+                break
+            
+            remaining = max_wait - (time.time() - start)
+            if remaining <= 0:
+                print(f"⚠️ {', '.join(waiting)} episodes still processing; continuing")
+                return
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 8)
         print("✅ Processing wait complete")
     
-    def query_graph_episodes(self) -> Dict:
-        """Query and analyze episodes from the graph"""
+    def _submit_graph_queries(self, executor) -> Dict[str, Any]:
+        """Start listing the graph's nodes, edges and episodes on executor"""
+        graph = self.client.graph
+        return {
+            # Every node and edge, paged through the list endpoints
+            "nodes": executor.submit(list_all, graph.node.get_by_graph_id, self.graph_id),
+            "edges": executor.submit(list_all, graph.edge.get_by_graph_id, self.graph_id),
+            # Most recent episodes
+            "episodes": executor.submit(
+                graph.episode.get_by_graph_id, self.graph_id, lastn=EPISODE_LIMIT
+            )
+        }
+    
+    def query_graph_episodes(self, pending: Dict[str, Any] = None) -> Dict:
+        """Query and analyze episodes from the graph
+        
+        pending holds calls already started by _submit_graph_queries;
+        without it the calls are issued here, side by side.
+        """
         print(f"\n🔍 Querying episodes for graph: {self.graph_id}")
         results = {
             "graph_id": self.graph_id,
@@ -186,62 +313,44 @@ class ZepEpisodeAnalyzer:
         }
         
         try:
-            # Search for all nodes in the graph
-            node_results = self.client.graph.search(
-                graph_id=self.graph_id,
-                query="all entities and information",
-                scope="nodes",
-                limit=50
-            )
+            if pending is None:
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    pending = self._submit_graph_queries(executor)
             
-            if node_results.nodes:
-                print(f"📊 Found {len(node_results.nodes)} entities in graph")
-                for node in node_results.nodes:
+            nodes = pending["nodes"].result()
+            if nodes:
+                print(f"📊 Found {len(nodes)} entities in graph")
+                for node in nodes:
                     entity_info = {
-                        "name": node.name if hasattr(node, 'name') else "Unknown",
-                        "type": node.labels[-1] if hasattr(node, 'labels') and node.labels else "Entity",
-                        "labels": node.labels if hasattr(node, 'labels') else [],
-                        "summary": node.summary if hasattr(node, 'summary') else None
+                        "name": getattr(node, 'name', "Unknown"),
+                        "type": node.labels[-1] if getattr(node, 'labels', None) else "Entity",
+                        "labels": getattr(node, 'labels', None) or [],
+                        "summary": getattr(node, 'summary', None)
                     }
                     results["entities"].append(entity_info)
                     print(f"  • Entity: {entity_info['name']} (Type: {entity_info['type']})")
             
-            # Search for all edges in the graph
-            edge_results = self.client.graph.search(
-                graph_id=self.graph_id,
-                query="all relationships and connections",
-                scope="edges",
-                limit=50
-            )
-            
-            if edge_results.edges:
-                print(f"🔗 Found {len(edge_results.edges)} relationships in graph")
-                for edge in edge_results.edges:
+            edges = pending["edges"].result()
+            if edges:
+                print(f"🔗 Found {len(edges)} relationships in graph")
+                for edge in edges:
                     edge_info = {
-                        "fact": edge.fact if hasattr(edge, 'fact') else "Unknown",
-                        "type": edge.name if hasattr(edge, 'name') else "RELATES_TO",
-                        "valid_at": edge.valid_at if hasattr(edge, 'valid_at') else None,
-                        "invalid_at": edge.invalid_at if hasattr(edge, 'invalid_at') else None
+                        "fact": getattr(edge, 'fact', "Unknown"),
+                        "type": getattr(edge, 'name', "RELATES_TO"),
+                        "valid_at": getattr(edge, 'valid_at', None),
+                        "invalid_at": getattr(edge, 'invalid_at', None)
                     }
                     results["edges"].append(edge_info)
-                    print(f"  • Edge: {edge_info['type']} - {edge_info['fact'][:80]}...")
-            
-            # Try to get episode information
-            # Note: Direct episode queries may require different API endpoints
-            episode_results = self.client.graph.search(
-                graph_id=self.graph_id,
-                query="data sources and episodes",
-                scope="episodes",
-                limit=10
-            )
+                    print(f"  • Edge: {edge_info['type']} - {edge_info['fact']:.80}...")
             
-            if hasattr(episode_results, 'episodes') and episode_results.episodes:
+            episode_results = pending["episodes"].result()
+            if getattr(episode_results, 'episodes', None):
                 print(f"📝 Found {len(episode_results.episodes)} episodes")
                 for ep in episode_results.episodes:
                     episode_info = {
-                        "id": ep.uuid if hasattr(ep, 'uuid') else None,
-                        "name": ep.name if hasattr(ep, 'name') else "Unknown",
-                        "created_at": ep.created_at if hasattr(ep, 'created_at') else None
+                        "id": getattr(ep, 'uuid_', None),
+                        "name": getattr(ep, 'name', "Unknown"),
+                        "created_at": getattr(ep, 'created_at', None)
                     }
                     results["episodes"].append(episode_info)
             
@@ -250,8 +359,30 @@ class ZepEpisodeAnalyzer:
         
         return results
     
-    def query_user_episodes(self) -> Dict:
-        """Query and analyze episodes from the user graph"""
+    def _submit_user_queries(self, executor) -> Dict[str, Any]:
+        """Start the user's context lookup and the listing of its nodes, edges
+        and episodes on executor"""
+        graph = self.client.graph
+        return {
+            # Get user context
+            "context": executor.submit(
+                self.client.thread.get_user_context, thread_id=self.thread_id
+            ),
+            # Every node and edge in the user graph, paged through the list endpoints
+            "nodes": executor.submit(list_all, graph.node.get_by_user_id, self.user_id),
+            "edges": executor.submit(list_all, graph.edge.get_by_user_id, self.user_id),
+            # Most recent episodes
+            "episodes": executor.submit(
+                graph.episode.get_by_user_id, self.user_id, lastn=EPISODE_LIMIT
+            )
+        }
+    
+    def query_user_episodes(self, pending: Dict[str, Any] = None) -> Dict:
+        """Query and analyze episodes from the user graph
+        
+        pending holds calls already started by _submit_user_queries; without
+        it the calls are issued here, side by side.
+        """
         print(f"\n🔍 Querying episodes for user: {self.user_id}")
         results = {
             "user_id": self.user_id,
@@ -262,8 +393,11 @@ class ZepEpisodeAnalyzer:
         }
         
         try:
-            # Get user context
-            memory = self.client.thread.get_user_context(thread_id=self.thread_id)
+            if pending is None:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    pending = self._submit_user_queries(executor)
+            
+            memory = pending["context"].result()
             if memory.context:
                 results["context"] = memory.context
                 print("📝 Retrieved user context")
@@ -272,22 +406,15 @@ class ZepEpisodeAnalyzer:
                     if line.strip():
                         print(f"  {line.strip()}")
             
-            # Search for entities in user graph
-            node_results = self.client.graph.search(
-                user_id=self.user_id,
-                query="all people, companies, projects, and preferences",
-                scope="nodes",
-                limit=50
-            )
-            
-            if node_results.nodes:
-                print(f"📊 Found {len(node_results.nodes)} entities in user graph")
-                for node in node_results.nodes:
+            nodes = pending["nodes"].result()
+            if nodes:
+                print(f"📊 Found {len(nodes)} entities in user graph")
+                for node in nodes:
                     entity_info = {
-                        "name": node.name if hasattr(node, 'name') else "Unknown",
-                        "type": node.labels[-1] if hasattr(node, 'labels') and node.labels else "Entity",
-                        "labels": node.labels if hasattr(node, 'labels') else [],
-                        "attributes": node.attributes if hasattr(node, 'attributes') else {}
+                        "name": getattr(node, 'name', "Unknown"),
+                        "type": node.labels[-1] if getattr(node, 'labels', None) else "Entity",
+                        "labels": getattr(node, 'labels', None) or [],
+                        "attributes": getattr(node, 'attributes', {})
                     }
                     results["entities"].append(entity_info)
                     
@@ -295,38 +422,24 @@ class ZepEpisodeAnalyzer:
                     entity_type = entity_info['type']
                     print(f"  • {entity_type}: {entity_info['name']}")
             
-            # Search for relationships in user graph
-            edge_results = self.client.graph.search(
-                user_id=self.user_id,
-                query="all relationships, employment, and interactions",
-                scope="edges",
-                limit=50
-            )
-            
-            if edge_results.edges:
-                print(f"🔗 Found {len(edge_results.edges)} relationships in user graph")
-                for edge in edge_results.edges:
+            edges = pending["edges"].result()
+            if edges:
+                print(f"🔗 Found {len(edges)} relationships in user graph")
+                for edge in edges:
                     edge_info = {
-                        "fact": edge.fact if hasattr(edge, 'fact') else "Unknown",
-                        "type": edge.name if hasattr(edge, 'name') else "RELATES_TO",
-                        "valid_at": edge.valid_at if hasattr(edge, 'valid_at') else None,
-                        "invalid_at": edge.invalid_at if hasattr(edge, 'invalid_at') else None
+                        "fact": getattr(edge, 'fact', "Unknown"),
+                        "type": getattr(edge, 'name', "RELATES_TO"),
+                        "valid_at": getattr(edge, 'valid_at', None),
+                        "invalid_at": getattr(edge, 'invalid_at', None)
                     }
                     results["edges"].append(edge_info)
                     
                     # Group by type
                     edge_type = edge_info['type']
-                    print(f"  • {edge_type}: {edge_info['fact'][:80]}...")
+                    print(f"  • {edge_type}: {edge_info['fact']:.80}...")
             
-            # Try to get episode information
-            episode_results = self.client.graph.search(
-                user_id=self.user_id,
-                query="conversation messages and episodes",
-                scope="episodes",
-                limit=10
-            )
-            
-            if hasattr(episode_results, 'episodes') and episode_results.episodes:
+            episode_results = pending["episodes"].result()
+            if getattr(episode_results, 'episodes', None):
                 print(f"📝 Found {len(episode_results.episodes)} episodes")
                 results["episodes"] = episode_results.episodes
             
@@ -336,90 +449,42 @@ class ZepEpisodeAnalyzer:
         return results
     
     def generate_report(self, graph_results: Dict, user_results: Dict):
-        """Generate comprehensive analysis report"""
-        print("\n" + "=" * 60)
-        print("EPISODE ANALYSIS REPORT")
-        print("=" * 60)
-        
-        # Graph Analysis
-        print(f"\n📊 GRAPH ANALYSIS ({graph_results['graph_id']})")
-        print("-" * 40)
-        
-        print(f"\nEntities Summary:")
-        entity_types = {}
-        for entity in graph_results['entities']:
-            etype = entity['type']
-            if etype not in entity_types:
-                entity_types[etype] = []
-            entity_types[etype].append(entity['name'])
-        
-        for etype, names in entity_types.items():
-            print(f"\n{etype} ({len(names)} found):")
-            for name in names[:5]:  # Show first 5
-                print(f"  • {name}")
-            if len(names) > 5:
-                print(f"  ... and {len(names) - 5} more")
+        """Generate comprehensive analysis report
         
-        print(f"\nRelationships Summary:")
-        edge_types = {}
-        for edge in graph_results['edges']:
-            etype = edge['type']
-            if etype not in edge_types:
-                edge_types[etype] = []
-            edge_types[etype].append(edge['fact'])
-        
-        for etype, facts in edge_types.items():
-            print(f"\n{etype} ({len(facts)} found):")
-            for fact in facts[:3]:  # Show first 3
-                print(f"  • {fact[:100]}...")
-            if len(facts) > 3:
-                print(f"  ... and {len(facts) - 3} more")
-        
-        # User Analysis
-        print(f"\n\n👤 USER ANALYSIS ({user_results['user_id']})")
-        print("-" * 40)
-        
-        print(f"\nEntities Summary:")
-        user_entity_types = {}
-        for entity in user_results['entities']:
-            etype = entity['type']
-            if etype not in user_entity_types:
-                user_entity_types[etype] = []
-            user_entity_types[etype].append(entity['name'])
-        
-        for etype, names in user_entity_types.items():
-            print(f"\n{etype} ({len(names)} found):")
-            for name in names[:5]:
-                print(f"  • {name}")
-            if len(names) > 5:
-                print(f"  ... and {len(names) - 5} more")
-        
-        print(f"\nRelationships Summary:")
-        user_edge_types = {}
-        for edge in user_results['edges']:
-            etype = edge['type']
-            if etype not in user_edge_types:
-                user_edge_types[etype] = []
-            user_edge_types[etype].append(edge['fact'])
-        
-        for etype, facts in user_edge_types.items():
-            print(f"\n{etype} ({len(facts)} found):")
-            for fact in facts[:3]:
-                print(f"  • {fact[:100]}...")
-            if len(facts) > 3:
-                print(f"  ... and {len(facts) - 3} more")
-        
-        # Summary Statistics
-        print("\n\n📈 SUMMARY STATISTICS")
-        print("-" * 40)
-        print(f"Graph Entities: {len(graph_results['entities'])}")
-        print(f"Graph Relationships: {len(graph_results['edges'])}")
-        print(f"User Entities: {len(user_results['entities'])}")
-        print(f"User Relationships: {len(user_results['edges'])}")
-        print(f"\nTotal Unique Entity Types: {len(set(list(entity_types.keys()) + list(user_entity_types.keys())))}")
-        print(f"Total Unique Edge Types: {len(set(list(edge_types.keys()) + list(user_edge_types.keys())))}")
+        The report is assembled as a list of lines and printed in one write.
+        """
+        entity_types = _group_by(graph_results['entities'], 'type', 'name')
+        edge_types = _group_by(graph_results['edges'], 'type', 'fact')
+        user_entity_types = _group_by(user_results['entities'], 'type', 'name')
+        user_edge_types = _group_by(user_results['edges'], 'type', 'fact')
+        
+        lines = [
+            "\n" + "=" * 60,
+            "EPISODE ANALYSIS REPORT",
+            "=" * 60,
+            # Graph Analysis
+            f"\n📊 GRAPH ANALYSIS ({graph_results['graph_id']})",
+            "-" * 40,
+            *_entity_group_lines(entity_types),
+            *_edge_group_lines(edge_types),
+            # User Analysis
+            f"\n\n👤 USER ANALYSIS ({user_results['user_id']})",
+            "-" * 40,
+            *_entity_group_lines(user_entity_types),
+            *_edge_group_lines(user_edge_types),
+            # Summary Statistics
+            "\n\n📈 SUMMARY STATISTICS",
+            "-" * 40,
+            f"Graph Entities: {len(graph_results['entities'])}",
+            f"Graph Relationships: {len(graph_results['edges'])}",
+            f"User Entities: {len(user_results['entities'])}",
+            f"User Relationships: {len(user_results['edges'])}",
+            f"\nTotal Unique Entity Types: {len(entity_types.keys() | user_entity_types.keys())}",
+            f"Total Unique Edge Types: {len(edge_types.keys() | user_edge_types.keys())}"
+        ]
+        print("\n".join(lines))
 
-def main():
+def main(fresh: bool = False):
     """Main execution function"""
     print("=" * 60)
     print("ZEP EPISODE ANALYSIS POC")
@@ -432,19 +497,24 @@ def main():
     print("-" * 40)
     data = analyzer.load_sample_data()
     
-    graph_id = analyzer.create_and_populate_graph(data["company_data"])
+    graph_id = analyzer.create_and_populate_graph(data["company_data"], reuse=not fresh)
     user_id, thread_id = analyzer.create_and_populate_user(data["conversation_text"])
     
     # Step B: Wait for processing
     print("\n⏱️ STEP B: Wait for Episode Processing")
     print("-" * 40)
-    analyzer.wait_for_processing(30)
+    analyzer.wait_for_processing(60)
     
     # Step C: Query episodes
     print("\n🔎 STEP C: Query Episodes")
     print("-" * 40)
-    graph_results = analyzer.query_graph_episodes()
-    user_results = analyzer.query_user_episodes()
+    # Start every graph and user query at once, then report each subject in
+    # turn as its results arrive
+    with ThreadPoolExecutor(max_workers=7) as executor:
+        graph_pending = analyzer._submit_graph_queries(executor)
+        user_pending = analyzer._submit_user_queries(executor)
+        graph_results = analyzer.query_graph_episodes(graph_pending)
+        user_results = analyzer.query_user_episodes(user_pending)
     
     # Step D: Present analysis
     print("\n📊 STEP D: Present Entity/Edge Analysis")
@@ -466,7 +536,10 @@ def main():
     }
 
 if __name__ == "__main__":
-    results = main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fresh", action="store_true",
+                        help="create and populate a new graph even if the data is unchanged")
+    results = main(fresh=parser.parse_args().fresh)
     print("\n📋 Final Summary:")
     for key, value in results.items():
         print(f"  {key}: {value}")
\ No newline at end of file
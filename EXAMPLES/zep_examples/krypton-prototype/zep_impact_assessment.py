@@ -8,6 +8,8 @@ import os
 import uuid
 import json
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
@@ -18,6 +20,10 @@ from dataclasses import dataclass, field
 # Load environment variables
 load_dotenv()
 
+# Broad searches used to capture the entities and edges of a snapshot
+NODE_QUERY = "TechCorp CloudManager Jane Smith CEO employees cloud computing software"
+EDGE_QUERY = "founded specializes CEO experience product used by employees"
+
 @dataclass
 class GraphSnapshot:
     """Represents a snapshot of graph state at a point in time"""
@@ -96,6 +102,11 @@ class ZepImpactAssessor:
         self.client = Zep(api_key=api_key)
         print("✅ Connected to Zep Impact Assessor")
     
+    def _search(self, scope: str, query: str, graph_id: str = None, user_id: str = None):
+        """Search a graph, or the user's graph when no graph_id is given"""
+        owner = {"graph_id": graph_id} if graph_id else {"user_id": user_id}
+        return self.client.graph.search(**owner, query=query, scope=scope, limit=50)
+    
     def capture_graph_snapshot(self, graph_id: str = None, user_id: str = None) -> GraphSnapshot:
         """Capture current state of a graph or user graph"""
         snapshot = GraphSnapshot(
@@ -105,23 +116,12 @@ class ZepImpactAssessor:
         )
         
         try:
-            # Get all entities - use a broader search
-            query = "TechCorp CloudManager Jane Smith CEO employees cloud computing software"
-            if graph_id:
-                node_results = self.client.graph.search(
-                    graph_id=graph_id,
-                    query=query,
-                    scope="nodes",
-                    limit=50
-                )
-            else:
-                node_results = self.client.graph.search(
-                    user_id=user_id,
-                    query=query,
-                    scope="nodes",
-                    limit=50
-                )
+            # Run the entity and edge searches side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                node_future = executor.submit(self._search, "nodes", NODE_QUERY, graph_id, user_id)
+                edge_future = executor.submit(self._search, "edges", EDGE_QUERY, graph_id, user_id)
             
+            node_results = node_future.result()
             if node_results.nodes:
                 for node in node_results.nodes:
                     entity_data = {
@@ -133,30 +133,11 @@ class ZepImpactAssessor:
                         "created_at": node.created_at if hasattr(node, 'created_at') else None
                     }
                     snapshot.entities.append(entity_data)
-                    
-                    # Track entity types
-                    entity_type = entity_data["type"]
-                    snapshot.entity_types[entity_type] = snapshot.entity_types.get(entity_type, 0) + 1
             
             snapshot.entity_count = len(snapshot.entities)
+            snapshot.entity_types = dict(Counter(e["type"] for e in snapshot.entities))
             
-            # Get all edges - use a broader search
-            query = "founded specializes CEO experience product used by employees"
-            if graph_id:
-                edge_results = self.client.graph.search(
-                    graph_id=graph_id,
-                    query=query,
-                    scope="edges",
-                    limit=50
-                )
-            else:
-                edge_results = self.client.graph.search(
-                    user_id=user_id,
-                    query=query,
-                    scope="edges",
-                    limit=50
-                )
-            
+            edge_results = edge_future.result()
             if edge_results.edges:
                 for edge in edge_results.edges:
                     edge_data = {
@@ -168,12 +149,9 @@ class ZepImpactAssessor:
                         "created_at": edge.created_at if hasattr(edge, 'created_at') else None
                     }
                     snapshot.edges.append(edge_data)
-                    
-                    # Track edge types
-                    edge_type = edge_data["type"]
-                    snapshot.edge_types[edge_type] = snapshot.edge_types.get(edge_type, 0) + 1
             
             snapshot.edge_count = len(snapshot.edges)
+            snapshot.edge_types = dict(Counter(e["type"] for e in snapshot.edges))
             
         except Exception as e:
             print(f"⚠️ Error capturing snapshot: {e}")
@@ -181,8 +159,15 @@ class ZepImpactAssessor:
         return snapshot
     
     def wait_for_episode_processing(self, episode_uuid: str, max_wait: int = 60) -> float:
-        """Wait for episode to be processed and return processing time"""
+        """Wait for episode to be processed and return processing time
+        
+        Polls with exponential backoff (0.5s doubling to 8s) after a short
+        initial pause, so quick episodes are seen promptly and slow ones are
+        not polled every couple of seconds.
+        """
         start_time = time.time()
+        delay = 0.5
+        time.sleep(0.2)
         
         while time.time() - start_time < max_wait:
             try:
@@ -194,52 +179,46 @@ class ZepImpactAssessor:
             except Exception as e:
                 print(f"⚠️ Error checking episode status: {e}")
             
-            time.sleep(2)
+            time.sleep(min(delay, max(0, max_wait - (time.time() - start_time))))
+            delay = min(delay * 2, 8.0)
         
         print(f"⚠️ Episode processing timeout after {max_wait} seconds")
         return time.time() - start_time
     
     def compare_snapshots(self, before: GraphSnapshot, after: GraphSnapshot) -> Tuple[List, List, List, List]:
         """Compare two snapshots and identify changes"""
-        # Create lookup sets for efficient comparison
-        before_entity_uuids = {e["uuid"] for e in before.entities if e["uuid"]}
-        after_entity_uuids = {e["uuid"] for e in after.entities if e["uuid"]}
-        
-        before_edge_uuids = {e["uuid"] for e in before.edges if e["uuid"]}
-        after_edge_uuids = {e["uuid"] for e in after.edges if e["uuid"]}
+        # Index the before snapshot by UUID for constant-time lookups
+        before_entities_by_uuid = {e["uuid"]: e for e in before.entities if e["uuid"]}
+        before_edges_by_uuid = {e["uuid"]: e for e in before.edges if e["uuid"]}
         
         # Find added entities (in after but not in before)
         entities_added = [e for e in after.entities 
-                         if e["uuid"] and e["uuid"] not in before_entity_uuids]
+                         if e["uuid"] and e["uuid"] not in before_entities_by_uuid]
         
         # Find modified entities (same UUID but different content)
         entities_modified = []
         for after_entity in after.entities:
-            if after_entity["uuid"] in before_entity_uuids:
-                # Find corresponding before entity
-                before_entity = next((e for e in before.entities if e["uuid"] == after_entity["uuid"]), None)
-                if before_entity and before_entity["summary"] != after_entity["summary"]:
-                    entities_modified.append({
-                        "entity": after_entity,
-                        "change": "summary_updated"
-                    })
+            before_entity = before_entities_by_uuid.get(after_entity["uuid"])
+            if before_entity and before_entity["summary"] != after_entity["summary"]:
+                entities_modified.append({
+                    "entity": after_entity,
+                    "change": "summary_updated"
+                })
         
         # Find added edges
         edges_added = [e for e in after.edges 
-                      if e["uuid"] and e["uuid"] not in before_edge_uuids]
+                      if e["uuid"] and e["uuid"] not in before_edges_by_uuid]
         
         # Find modified edges (e.g., invalidated facts)
         edges_modified = []
         for after_edge in after.edges:
-            if after_edge["uuid"] in before_edge_uuids:
-                before_edge = next((e for e in before.edges if e["uuid"] == after_edge["uuid"]), None)
-                if before_edge:
-                    # Check if invalidation status changed
-                    if before_edge["invalid_at"] != after_edge["invalid_at"]:
-                        edges_modified.append({
-                            "edge": after_edge,
-                            "change": "invalidated" if after_edge["invalid_at"] else "revalidated"
-                        })
+            before_edge = before_edges_by_uuid.get(after_edge["uuid"])
+            # Check if invalidation status changed
+            if before_edge and before_edge["invalid_at"] != after_edge["invalid_at"]:
+                edges_modified.append({
+                    "edge": after_edge,
+                    "change": "invalidated" if after_edge["invalid_at"] else "revalidated"
+                })
         
         return entities_added, entities_modified, edges_added, edges_modified
     